@@ -0,0 +1,39 @@
+import math
+import pygame
+
+from game.creatures import Creature
+
+
+def resolve_creature_contacts(players, creature_grid):
+    """
+    Per-tick contact phase between creatures and players.
+
+    One radius query per living player on the creature grid collects both rect
+    overlaps (contact damage) and action-attack candidates (cleave range); damage is
+    dispatched afterwards. Each action creature swings at its nearest player within
+    twice its cleave range, through Creature.start_action_attack.
+    """
+    now = pygame.time.get_ticks()
+    # Far enough to catch the longest cleave and any creature rect touching the player
+    overlap_reach = math.sqrt(2) * creature_grid.max_extent
+    nearest = {}
+
+    for slot, player in enumerate(players):
+        if player.dead:
+            continue
+        prect = player.rect
+        reach = max(Creature.MAX_ACTION_REACH, math.hypot(prect.width, prect.height) / 2 + overlap_reach)
+        for creature, dist in creature_grid.query_radius(prect.centerx, prect.centery, reach):
+            if creature.hp <= 0:
+                continue
+            if creature.action_type:
+                if dist <= creature.cleave_range * 2:
+                    best = nearest.get(creature)
+                    if best is None or dist < best[0]:
+                        nearest[creature] = (dist, player)
+            elif creature.attack_profile and prect.colliderect(creature.rect):
+                creature.attack_profile.try_hit(creature, slot, player, now)
+
+    for creature, (_, player) in nearest.items():
+        if creature.action_attack_ready(now):
+            creature.start_action_attack(player, now)
@@ -0,0 +1,252 @@
+import math
+from collections import deque
+
+# 8-connected neighbours; diagonal steps cost the same as straight ones
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+UNREACHED = -1
+# The field region moves in whole chunks so it only reloads when the camera crosses one
+CHUNK_TILES = 8
+
+
+class FlowField:
+    """
+    Breadth-first distance field (in tiles) from every living player's tile over the
+    wall grid of the active region around the camera. Creatures read their next step
+    in O(1), so a whole horde navigates for the price of one field.
+
+    The field is kept exact incrementally, touching only tiles whose distance changes:
+      - when a player steps onto a new tile, a lowering wavefront from that tile only
+        visits tiles that got closer;
+      - when a player leaves a tile, or the region drops a strip, the cone of tiles
+        whose shortest path ran through it is invalidated (raise) and refilled from
+        the still-valid tiles around it (repair);
+      - strips the region loads are filled from their already-valid neighbours.
+    """
+    def __init__(self, radius=24):
+        self.radius = radius  # tiles kept around the camera center
+        self.tile_size = None
+        self.origin_col = 0
+        self.origin_row = 0
+        self.width = 0
+        self.height = 0
+        self.dist = []
+        self.blocked = bytearray()
+        self.links = []
+        self.sources = ()
+        self._step_cache = {}
+
+    def update(self, players, world, tile_size, center):
+        """
+        Advance the field for this tick. `center` is the world-pixel center of the
+        active simulation region (normally the camera center).
+        """
+        if tile_size != self.tile_size:
+            self.tile_size = tile_size
+            self.width = self.height = 0
+            self.dist = []
+        ts = tile_size
+        r = self.radius
+        center_col = int(center[0] // ts)
+        center_row = int(center[1] // ts)
+        origin_col = (center_col - r) // CHUNK_TILES * CHUNK_TILES
+        origin_row = (center_row - r) // CHUNK_TILES * CHUNK_TILES
+        width = -(-(center_col + r + 1 - origin_col) // CHUNK_TILES) * CHUNK_TILES
+        height = -(-(center_row + r + 1 - origin_row) // CHUNK_TILES) * CHUNK_TILES
+        if (origin_col, origin_row, width, height) != (self.origin_col, self.origin_row, self.width, self.height) or not self.dist:
+            self._load_region(world, origin_col, origin_row, width, height)
+
+        sources = tuple(sorted({
+            (p.rect.centerx // ts, p.rect.centery // ts) for p in players
+            if not p.dead and self._index(p.rect.centerx // ts, p.rect.centery // ts) is not None
+        }))
+        if sources != self.sources:
+            added = set(sources) - set(self.sources)
+            removed = set(self.sources) - set(sources)
+            self.sources = sources
+            if added:
+                self._lower(added)
+            if removed:
+                self._repair(self._raise(self._index(*s) for s in removed))
+
+    def _load_region(self, world, origin_col, origin_row, width, height):
+        """Move the field to a new region, keeping what is known about the overlap."""
+        size = width * height
+        dist = [UNREACHED] * size
+        blocked = bytearray(size)
+        links = [None] * size
+        loaded = []
+        edge = []
+        # Link offsets only carry over between regions of the same width
+        old_w = self.width if width == self.width else 0
+        old_h = self.height
+        for r in range(height):
+            row = origin_row + r
+            for c in range(width):
+                col = origin_col + c
+                k = r * width + c
+                old = self._index(col, row)
+                if old is not None:
+                    blocked[k] = self.blocked[old]
+                    dist[k] = self.dist[old]
+                    on_edge = r == 0 or c == 0 or r == height - 1 or c == width - 1
+                    if on_edge:
+                        edge.append(k)
+                    elif old_w and 0 < old % old_w < old_w - 1 and 0 < old // old_w < old_h - 1:
+                        links[k] = self.links[old]
+                else:
+                    blocked[k] = 1 if world.get_tile(col, row) == 'W' else 0
+                    loaded.append(k)
+        self.origin_col, self.origin_row = origin_col, origin_row
+        self.width, self.height = width, height
+        self.dist = dist
+        self.blocked = blocked
+        self.links = [offsets if offsets is not None else self._link(i) for i, offsets in enumerate(links)]
+        self.sources = tuple(s for s in self.sources if self._index(*s) is not None)
+        # Kept tiles on the new edge may have been reached through the strip just dropped
+        self._repair(self._raise(edge) + loaded)
+
+    def _index(self, col, row):
+        c = col - self.origin_col
+        r = row - self.origin_row
+        if 0 <= c < self.width and 0 <= r < self.height:
+            return r * self.width + c
+        return None
+
+    def _link(self, i):
+        """Index offsets of the tiles one step from tile `i`, without cutting corners between two walls."""
+        w, h = self.width, self.height
+        blocked = self.blocked
+        c, r = i % w, i // w
+        links = []
+        for dc, dr in NEIGHBOURS:
+            nc, nr = c + dc, r + dr
+            if not (0 <= nc < w and 0 <= nr < h):
+                continue
+            if dc and dr and (blocked[r * w + nc] or blocked[nr * w + c]):
+                continue
+            links.append(nr * w + nc - i)
+        return tuple(links)
+
+    def _expand(self, queue, seeds=()):
+        """
+        Relax tiles outward from `queue`, only ever lowering distances. `seeds` are
+        tiles sorted by distance that join the wavefront when it reaches their distance,
+        so a wavefront started from tiles at different distances stays breadth-first.
+        """
+        dist = self.dist
+        blocked = self.blocked
+        links = self.links
+        s = 0
+        while queue or s < len(seeds):
+            if s < len(seeds) and (not queue or dist[seeds[s]] <= dist[queue[0]]):
+                i = seeds[s]
+                s += 1
+            else:
+                i = queue.popleft()
+            d = dist[i] + 1
+            for o in links[i]:
+                j = i + o
+                if blocked[j] or (dist[j] != UNREACHED and dist[j] <= d):
+                    continue
+                dist[j] = d
+                queue.append(j)
+        self._step_cache = {}
+
+    def _lower(self, sources):
+        """New source tiles: only tiles that got closer are touched."""
+        queue = deque()
+        for col, row in sources:
+            i = self._index(col, row)
+            if i is not None and self.dist[i] != 0:
+                self.dist[i] = 0
+                queue.append(i)
+        self._expand(queue)
+
+    def _raise(self, candidates):
+        """
+        Invalidate every tile in `candidates`, and every tile reached through one of
+        them, that no longer has a neighbour one step closer to a current source.
+        Tiles are settled nearest first, like _expand, so a tile's support is final
+        when it is checked. Returns the invalidated tiles.
+        """
+        dist = self.dist
+        links = self.links
+        sources = {self._index(*s) for s in self.sources}
+        seeds = sorted((i for i in candidates if dist[i] != UNREACHED), key=dist.__getitem__)
+        queue = deque()
+        invalid = []
+        s = 0
+        while queue or s < len(seeds):
+            if s < len(seeds) and (not queue or dist[seeds[s]] <= dist[queue[0]]):
+                i = seeds[s]
+                s += 1
+            else:
+                i = queue.popleft()
+            d = dist[i]
+            if d == UNREACHED:
+                continue  # already invalidated
+            if d == 0:
+                if i in sources:
+                    continue
+            elif any(dist[i + o] == d - 1 for o in links[i]):
+                continue
+            dist[i] = UNREACHED
+            invalid.append(i)
+            for o in links[i]:
+                if dist[i + o] == d + 1:
+                    queue.append(i + o)
+        return invalid
+
+    def _repair(self, invalid):
+        """Refill unreached tiles from the valid tiles bordering them."""
+        dist = self.dist
+        links = self.links
+        seeds = {i + o for i in invalid for o in links[i] if dist[i + o] != UNREACHED}
+        self._expand(deque(), sorted(seeds, key=dist.__getitem__))
+
+    def direction_at(self, x, y):
+        """
+        Unit (dx, dy) toward the center of the neighbouring tile closest to a player,
+        or None when off the field, unreachable, or already next to a player.
+        """
+        if not self.dist:
+            return None
+        ts = self.tile_size
+        col, row = int(x // ts), int(y // ts)
+        i = self._index(col, row)
+        if i is None:
+            return None
+        d = self.dist[i]
+        if d == UNREACHED or d <= 1:
+            return None
+
+        target = self._step_cache.get(i)
+        if target is None:
+            w = self.width
+            c, r = i % w, i // w
+            best = d
+            for dc, dr in NEIGHBOURS:
+                nc, nr = c + dc, r + dr
+                if not (0 <= nc < w and 0 <= nr < self.height):
+                    continue
+                nd = self.dist[nr * w + nc]
+                if nd == UNREACHED or nd >= best:
+                    continue
+                if dc and dr and (self.blocked[r * w + nc] or self.blocked[nr * w + c]):
+                    continue
+                best = nd
+                target = (col + dc, row + dr)
+            if target is None:
+                return None
+            self._step_cache[i] = target
+
+        dx = (target[0] + 0.5) * ts - x
+        dy = (target[1] + 0.5) * ts - y
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return None
+        return dx / length, dy / length
+
+
+# Shared field for all creatures; the main loop updates it once per tick
+FLOW_FIELD = FlowField()
@@ -0,0 +1,72 @@
+import math
+
+# (max distance in pixels from the nearest player, update every N ticks); beyond the last band
+# creatures update every FAR_INTERVAL ticks. set_viewport() pushes the bands out so the
+# full-rate band covers the whole screen.
+DEFAULT_BANDS = ((700, 1), (1100, 2), (1600, 4))
+FAR_INTERVAL = 8
+# Pixels past the screen's half-diagonal that still update at full rate
+SCREEN_MARGIN = 100
+
+
+class AILevelOfDetail:
+    """
+    Schedules creature AI by distance to the nearest living player. Near creatures
+    update every tick; creatures in farther bands update at 1/2, 1/4 or 1/8 rate,
+    staggered by id so the work is spread evenly across ticks. When a reduced-rate
+    creature does update, it steps by the number of ticks since its last update so it
+    covers the same ground. Far creatures skip turning to face a player, but their
+    cleave and hurt states still expire every tick (see Creature.update).
+    """
+    def __init__(self, bands=DEFAULT_BANDS, far_interval=FAR_INTERVAL):
+        self.bands = bands
+        self.far_interval = far_interval
+        self.band_scale = 1.0  # multiplies band distances; lower it to shed AI work sooner
+        self.screen_reach = 0  # no band is scaled below this, see set_viewport
+        self.frame = 0
+
+    def set_viewport(self, width, height, margin=SCREEN_MARGIN):
+        """
+        Keep every creature on a `width` x `height` screen at full rate: the first band
+        reaches past the screen's half-diagonal, later bands keep their spacing beyond
+        it, and band_scale can never pull a band inside that distance.
+        """
+        self.screen_reach = math.hypot(width, height) / 2 + margin
+        shift = self.screen_reach - self.bands[0][0]
+        if shift > 0:
+            self.bands = tuple((dist + shift, interval) for dist, interval in self.bands)
+
+    def begin_tick(self, players, creatures):
+        """Advance the tick and decide, in one pass, which creatures update this tick."""
+        self.frame += 1
+        frame = self.frame
+        centers = [p.rect.center for p in players if not p.dead] or [p.rect.center for p in players]
+        limits = [max(dist * self.band_scale, self.screen_reach) ** 2 for dist, _ in self.bands]
+        intervals = [interval for _, interval in self.bands]
+        for creature in creatures:
+            cx, cy = creature.rect.center
+            nearest = min(((px - cx) ** 2 + (py - cy) ** 2 for px, py in centers), default=0)
+            interval = self.far_interval
+            for limit, band_interval in zip(limits, intervals):
+                if nearest <= limit:
+                    interval = band_interval
+                    break
+            creature.lod_interval = interval
+            creature.lod_due = (frame + creature.id) % interval == 0
+
+    def steps_due(self, creature):
+        """
+        Number of ticks the creature should simulate now (0 = skip this tick). Catching up
+        is capped at the far interval so a creature that was idle for long does not teleport.
+        """
+        if not creature.lod_due:
+            return 0
+        last = creature.lod_last_frame
+        creature.lod_last_frame = self.frame
+        if last is None:
+            return 1
+        return min(self.frame - last, self.far_interval)
+
+
+# Shared scheduler; the main loop calls begin_tick once per tick before creatures update
+AI_LOD = AILevelOfDetail()
@@ -1,28 +1,83 @@
 import math
 
+from game.ai.flow_field import FLOW_FIELD
+
+def _step(creature, dx, dy):
+    # Update creature's float position; step_scale > 1 when AI LOD skipped ticks
+    distance = creature.speed * creature.step_scale
+    creature.x += dx * distance
+    creature.y += dy * distance
+
+    # Update the rect for collision and drawing
+    creature.rect.x = int(creature.x)
+    creature.rect.y = int(creature.y)
+
 class DirectApproach:
     """A movement profile where the creature moves directly towards the closest target."""
-    def move(self, creature, targets):
+    def heading(self, creature, targets):
+        """Unit vector toward the closest target, or None if there is none or it is already reached."""
         if not targets:
-            return
+            return None
 
         # Find closest target (player)
         closest_target = min(targets, key=lambda t: math.hypot(t.rect.centerx - creature.rect.centerx, t.rect.centery - creature.rect.centery))
-        
+
         dx = closest_target.rect.centerx - creature.rect.centerx
         dy = closest_target.rect.centery - creature.rect.centery
         dist = math.hypot(dx, dy)
-        
+
         # Move if not already overlapping with the target
         if dist > (creature.width / 2):
             # Normalize the vector
-            dx = dx / dist
-            dy = dy / dist
-            
-            # Update creature's float position
-            creature.x += dx * creature.speed
-            creature.y += dy * creature.speed
-            
-            # Update the rect for collision and drawing
-            creature.rect.x = int(creature.x)
-            creature.rect.y = int(creature.y) 
\ No newline at end of file
+            return dx / dist, dy / dist
+        return None
+
+    def move(self, creature, targets):
+        heading = self.heading(creature, targets)
+        if heading:
+            _step(creature, *heading)
+
+class FlowFieldApproach:
+    """
+    A movement profile that follows the shared flow field around walls toward the
+    nearest player, falling back to DirectApproach when next to the player or off the field.
+    """
+    def __init__(self, field=None):
+        self.field = field
+        self.direct = DirectApproach()
+
+    def heading(self, creature, targets):
+        field = self.field or FLOW_FIELD
+        step = field.direction_at(creature.rect.centerx, creature.rect.centery)
+        if step is None:
+            return self.direct.heading(creature, targets)
+        return step
+
+    def move(self, creature, targets):
+        heading = self.heading(creature, targets)
+        if heading:
+            _step(creature, *heading)
+
+class CrowdApproach:
+    """
+    A movement profile that blends a goal heading (the flow field by default) with the
+    crowd steering force computed for every creature by update_crowd_steering, so a
+    converging horde spreads out instead of stacking on one spot.
+    """
+    def __init__(self, goal=None):
+        self.goal = goal or FlowFieldApproach()
+
+    def move(self, creature, targets):
+        heading = self.goal.heading(creature, targets) or (0.0, 0.0)
+        dx = heading[0] + creature.steer_dx
+        dy = heading[1] + creature.steer_dy
+        length = math.hypot(dx, dy)
+        if length < 0.05:
+            creature.heading = (0.0, 0.0)
+            return
+        # Crowding can redirect a creature but never speed it up
+        if length > 1:
+            dx /= length
+            dy /= length
+        creature.heading = (dx, dy)
+        _step(creature, dx, dy)
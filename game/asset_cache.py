@@ -0,0 +1,105 @@
+import os
+import pygame
+
+ASSET_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+
+# Process-wide caches; every creature of a kind shares the same surfaces and masks
+_loaded_images = {}  # path -> full-size surface converted for alpha blitting
+_sprite_cache = {}  # (path, size, orientation) -> {'left': (surface, mask), 'right': (surface, mask)}
+_image_cache = {}   # (path, size) -> surface
+_font_cache = {}    # (path, size) -> pygame.font.Font
+_text_cache = {}    # (path, size, text, color) -> rendered text surface
+TEXT_CACHE_LIMIT = 512
+
+
+def asset_path(filename):
+    return os.path.join(ASSET_DIR, filename)
+
+
+def is_image_loaded(path):
+    return path in _loaded_images
+
+
+def store_image(path, surface):
+    """Register an already decoded and converted surface for `path` (see AssetManager)."""
+    _loaded_images[path] = surface
+
+
+def load_image(path):
+    """Full-size surface for `path`; read from disk only if it was not preloaded."""
+    img = _loaded_images.get(path)
+    if img is None:
+        img = pygame.image.load(path).convert_alpha()
+        _loaded_images[path] = img
+    return img
+
+
+def load_scaled_image(path, size):
+    """`path` smooth-scaled to `size`, once per (path, size)."""
+    key = (path, size)
+    img = _image_cache.get(key)
+    if img is None:
+        img = pygame.transform.smoothscale(load_image(path), size)
+        _image_cache[key] = img
+    return img
+
+
+def load_sprite(path, size, orientation):
+    """
+    Return {'left': (surface, mask), 'right': (surface, mask)} for a sprite drawn facing
+    `orientation` ('left' or 'right'); the opposite direction is the mirrored image.
+    Prepared once per (path, size, orientation) and shared by every caller.
+    """
+    key = (path, size, orientation)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        img = load_scaled_image(path, size)
+        flipped = pygame.transform.flip(img, True, False)
+        opposite = 'left' if orientation == 'right' else 'right'
+        sprite = {
+            orientation: (img, pygame.mask.from_surface(img)),
+            opposite: (flipped, pygame.mask.from_surface(flipped)),
+        }
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+def loaded_sprites():
+    """((path, size, orientation), sprite) pairs for every sprite prepared so far."""
+    return list(_sprite_cache.items())
+
+
+def loaded_scaled_images():
+    """(path, size) keys of every scaled image prepared so far."""
+    return list(_image_cache)
+
+
+def get_font(path, size):
+    """
+    Shared font for (path, size). Falls back to pygame's default font when `path` is
+    None or missing, so callers can ask every frame without touching disk again.
+    """
+    key = (path, size)
+    font = _font_cache.get(key)
+    if font is None:
+        if path is not None and os.path.exists(path):
+            font = pygame.font.Font(path, size)
+        else:
+            font = pygame.font.Font(None, size)
+        _font_cache[key] = font
+    return font
+
+
+def render_text(path, size, text, color):
+    """
+    Antialiased text rendered with get_font(path, size), cached per (path, size, text, color).
+    Meant for short labels that repeat every frame (countdowns, status words).
+    """
+    key = (path, size, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        if len(_text_cache) >= TEXT_CACHE_LIMIT:
+            _text_cache.clear()
+        surface = get_font(path, size).render(text, True, color)
+        _text_cache[key] = surface
+    return surface
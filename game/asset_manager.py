@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from game.asset_cache import asset_path, is_image_loaded, store_image
+from game.atlas import build_creature_atlas
+from game.creatures import MELEE_ACTION_FX, RANGED_ACTION_FX
+
+
+def collect_action_fx_paths():
+    """Image files of every action effect that has art."""
+    paths = []
+    for fx in list(MELEE_ACTION_FX) + list(RANGED_ACTION_FX):
+        path = asset_path(os.path.join('action_fx', f'{fx.value}.png'))
+        if os.path.exists(path):
+            paths.append(path)
+    return paths
+
+
+def collect_image_paths(pools):
+    """Every image the game can need: creature sprites from the pools plus all action effects."""
+    paths = []
+    for pool in pools:
+        for creature_class, _ in pool:
+            for filename, _ in (creature_class.IMAGE_FILES or {}).values():
+                paths.append(asset_path(filename))
+    paths.extend(collect_action_fx_paths())
+    # Keep order stable for the progress display, drop duplicates
+    return list(dict.fromkeys(paths))
+
+
+class AssetManager:
+    """
+    Preloads assets without blocking the main thread on disk:
+      1. image files are read and decoded on a background thread pool,
+      2. decoded images are converted to display format in small batches on the main
+         thread (conversion needs the display), each batch followed by a redraw,
+      3. every creature kind in the pools is built once so its scaled sprites and masks
+         land in the asset cache,
+      4. those sprites and pre-rotated action effects are packed into CREATURE_ATLAS.
+    Call process() once per frame until done, drawing `progress` in between.
+    """
+    def __init__(self, pools, workers=4, batch=4):
+        self.pools = pools
+        self.batch = batch
+        self.paths = [p for p in collect_image_paths(pools) if not is_image_loaded(p)]
+        self.creature_kinds = [entry for pool in pools for entry in pool]
+        self.total = len(self.paths) + len(self.creature_kinds) + 1  # + atlas packing
+        self.completed = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = [(path, self._executor.submit(pygame.image.load, path)) for path in self.paths]
+        self._kinds_left = list(self.creature_kinds)
+
+    @property
+    def progress(self):
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return self.completed >= self.total
+
+    def process(self):
+        """Do one main-thread batch of conversion or sprite preparation."""
+        budget = self.batch
+        # Convert decoded images in submission order; stop at the first that is still decoding
+        while self._pending and budget:
+            path, future = self._pending[0]
+            if not future.done():
+                return
+            self._pending.pop(0)
+            store_image(path, future.result().convert_alpha())
+            self.completed += 1
+            budget -= 1
+        if self._pending:
+            return
+        while self._kinds_left and budget:
+            creature_class, kwargs = self._kinds_left.pop(0)
+            creature_class(x=0, y=0, **kwargs)
+            self.completed += 1
+            budget -= 1
+        if self._kinds_left or not budget:
+            return
+        build_creature_atlas(collect_action_fx_paths())
+        self.completed += 1
+        self._executor.shutdown(wait=False)
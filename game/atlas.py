@@ -0,0 +1,102 @@
+import pygame
+
+from game.asset_cache import load_scaled_image, loaded_sprites, loaded_scaled_images
+
+# Action effects are pre-rotated in steps of this many degrees
+ROTATION_STEP = 5
+ROTATION_FRAMES = 360 // ROTATION_STEP
+PAGE_SIZE = 1024
+PADDING = 1  # transparent gap so smoothscaled edges never bleed into a neighbour
+
+
+def rotation_frame(angle):
+    """Index of the pre-rotated frame closest to `angle` degrees (pygame.transform.rotate convention)."""
+    return round(angle / ROTATION_STEP) % ROTATION_FRAMES
+
+
+class TextureAtlas:
+    """
+    Packs many small surfaces into a few large pages with a shelf packer: images are
+    placed left to right along a shelf as tall as the tallest image on it, and a new
+    shelf (or page) starts when one does not fit. get(key) returns (page, area) for
+    use as a blit source, e.g. in Surface.blits((page, dest, area), ...).
+    """
+    def __init__(self, page_size=PAGE_SIZE):
+        self.page_size = page_size
+        self.pages = []
+        self.regions = {}
+        self._page = None  # page being filled; oversized images get pages of their own
+        self._shelf_x = self._shelf_y = self._shelf_h = 0
+
+    def get(self, key):
+        return self.regions.get(key)
+
+    def add(self, key, surface):
+        if key in self.regions:
+            return self.regions[key]
+        w, h = surface.get_size()
+        pw, ph = w + PADDING, h + PADDING
+        if pw > self.page_size or ph > self.page_size:
+            # Too big to share a page
+            page = pygame.Surface((w, h), pygame.SRCALPHA)
+            page.blit(surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.pages.append(page)
+            self.regions[key] = (page, page.get_rect())
+            return self.regions[key]
+
+        if self._page is None or self._shelf_x + pw > self.page_size:
+            self._shelf_x = 0
+            self._shelf_y += self._shelf_h
+            self._shelf_h = 0
+        if self._page is None or self._shelf_y + ph > self.page_size:
+            self._start_page()
+        page = self._page
+        area = pygame.Rect(self._shelf_x, self._shelf_y, w, h)
+        # MAX onto the cleared page copies the pixels exactly instead of alpha blending them
+        page.blit(surface, area.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        self._shelf_x += pw
+        self._shelf_h = max(self._shelf_h, ph)
+        self.regions[key] = (page, area)
+        return self.regions[key]
+
+    def _start_page(self):
+        self._page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        self.pages.append(self._page)
+        self._shelf_x = self._shelf_y = self._shelf_h = 0
+
+    def finish(self):
+        """Convert the pages to display format once packing is done."""
+        converted = {}
+        for i, page in enumerate(self.pages):
+            converted[page] = self.pages[i] = page.convert_alpha()
+        if self._page is not None:
+            self._page = converted[self._page]
+        for key, (page, area) in self.regions.items():
+            self.regions[key] = (converted[page], area)
+
+
+# Shared atlas for creature sprites and their rotated action effects; filled by build_creature_atlas
+CREATURE_ATLAS = TextureAtlas()
+
+
+def build_creature_atlas(action_paths=()):
+    """
+    Pack every prepared creature sprite (both facings) and, for each scaled action effect
+    image under `action_paths`, all ROTATION_FRAMES rotations into CREATURE_ATLAS.
+    Tallest images go first so shelves waste less space.
+    """
+    entries = []
+    for (path, size, _), sprite in loaded_sprites():
+        for direction, (img, _) in sprite.items():
+            entries.append(((path, size, direction), img))
+    action_paths = set(action_paths)
+    for (path, size) in loaded_scaled_images():
+        if path in action_paths:
+            img = load_scaled_image(path, size)
+            for frame in range(ROTATION_FRAMES):
+                entries.append(((path, size, frame), pygame.transform.rotate(img, frame * ROTATION_STEP)))
+    entries.sort(key=lambda entry: entry[1].get_height(), reverse=True)
+    for key, img in entries:
+        CREATURE_ATLAS.add(key, img)
+    CREATURE_ATLAS.finish()
+    return CREATURE_ATLAS
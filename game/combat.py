@@ -1,8 +1,10 @@
 #  This packages all combat helpers into a single module for easier imports
 from game.helpers.combat_helpers.apply_creature_effects import apply_creature_effects
 from game.helpers.combat_helpers.apply_poison import apply_poison
+from game.helpers.combat_helpers.area_of_effect import query_area, apply_falloff_damage, apply_area_damage, apply_area_effects
 from game.helpers.combat_helpers.create_beam import create_beam
 from game.helpers.combat_helpers.create_bullet import create_bullet
+from game.helpers.combat_helpers.create_volley import create_shotgun_volley, create_spray_volley
 from game.helpers.combat_helpers.handle_creature_collision import handle_creature_collision
 from game.helpers.combat_helpers.handle_firing import handle_firing
 from game.helpers.combat_helpers.handle_piercing_collision import handle_piercing_collision
@@ -1,6 +1,9 @@
 import pygame
-from game.ai.movement import DirectApproach
+from game.ai.movement import CrowdApproach
 from game.ai.attacks import MeleeCollisionAttack
+from game.ai.lod import AI_LOD
+from game.asset_cache import asset_path, load_scaled_image, load_sprite
+from game.atlas import CREATURE_ATLAS, rotation_frame
 import math
 import itertools
 import os
@@ -48,6 +51,13 @@ class Creature:
         'gigantic': 0.95  # Takes 5% of knockback
     }
 
+    # Furthest a creature's action attack can reach (cleave_range * 2 for the largest size)
+    MAX_ACTION_REACH = 2 * max(24, int(SIZE_MAP['gigantic'] * 0.75))
+
+    # Sprite files for subclasses with art: {'walk': (filepath, orientation), 'hurt': (filepath, orientation)}.
+    # Declared on the class so the asset manager can preload them without building a creature.
+    IMAGE_FILES = None
+
     def __init__(
         self, x, y, size_str, hp, damage, speed, movement_profile, attack_profile, color=(0,255,0),
         image_files=None,  # {'walk': (filepath, orientation), 'hurt': (filepath, orientation)}
@@ -68,6 +78,7 @@ class Creature:
         self.size_str = size_str
         self.hp = hp
         self.max_hp = hp
+        self.pending_damage = 0  # dealt this tick, applied by DAMAGE.apply()
         self.damage = damage
         self.xp_value = xp_value
         self.speed = speed
@@ -91,6 +102,8 @@ class Creature:
         self.animation_state = 'walk'
         self.images = {}
         self.meshes = {}
+        self.atlas_keys = {}  # image key -> CREATURE_ATLAS key
+        self.action_atlas_key = None  # (path, size) of the action effect's pre-rotated frames
         self.hurt_time = None
         self.hurt_duration = 500
         self.attack_type = 'contact'  # All creatures have contact damage
@@ -109,35 +122,36 @@ class Creature:
         self.cleave_start_time = None
         self.is_cleaving = False
         self.xp_awarded = False
+        self.contact_attack_times = []  # last contact-hit time per player slot (see MeleeCollisionAttack)
+        self.steer_dx = 0.0  # crowd steering force (see update_crowd_steering)
+        self.steer_dy = 0.0
+        self.heading = (0.0, 0.0)  # last movement direction, read by neighbours for alignment
+        self.step_scale = 1  # ticks covered by the current movement step (see AI_LOD)
+        self.lod_interval = 1
+        self.lod_due = True
+        self.lod_last_frame = None
         # self.weapon = weapon  # (future use)
         if image_files:
             self.load_and_prepare_images(image_files)
 
     def load_and_prepare_images(self, image_files):
-        asset_dir = os.path.join(os.path.dirname(__file__), 'assets')
+        # Surfaces and masks come from the shared asset cache, so only the first creature of a kind touches disk
         for state in ['walk', 'hurt']:
             if state not in image_files:
                 raise FileNotFoundError(f"Required image for state '{state}' not found in image_files!")
             filename, orientation = image_files[state]
-            path = os.path.join(asset_dir, filename)
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.smoothscale(img, (self.width, self.height))
-            # Store the base direction
-            self.images[f'{state}_{orientation.value}'] = img
-            self.meshes[f'{state}_{orientation.value}'] = pygame.mask.from_surface(img)
-            # Flip for the opposite direction
-            opposite = 'left' if orientation == Orientation.RIGHT else 'right'
-            flipped_img = pygame.transform.flip(img, True, False)
-            self.images[f'{state}_{opposite}'] = flipped_img
-            self.meshes[f'{state}_{opposite}'] = pygame.mask.from_surface(flipped_img)
+            sprite = load_sprite(asset_path(filename), (self.width, self.height), orientation.value)
+            for direction, (img, mask) in sprite.items():
+                self.images[f'{state}_{direction}'] = img
+                self.meshes[f'{state}_{direction}'] = mask
+                self.atlas_keys[f'{state}_{direction}'] = (asset_path(filename), (self.width, self.height), direction)
         
         # Load action effect image if action_type is specified
         if self.action_type and self.action_fx:
-            action_path = os.path.join(asset_dir, 'action_fx', f'{self.action_fx.value}.png')
+            action_path = asset_path(os.path.join('action_fx', f'{self.action_fx.value}.png'))
             if os.path.exists(action_path):
-                action_img = pygame.image.load(action_path).convert_alpha()
-                action_img = pygame.transform.smoothscale(action_img, (self.cleave_range * 2, self.cleave_range * 2))
-                self.action_image = action_img
+                self.action_image = load_scaled_image(action_path, (self.cleave_range * 2, self.cleave_range * 2))
+                self.action_atlas_key = (action_path, (self.cleave_range * 2, self.cleave_range * 2))
             else:
                 # Create a simple effect if image doesn't exist
                 self.action_image = pygame.Surface((self.cleave_range * 2, self.cleave_range * 2), pygame.SRCALPHA)
@@ -162,45 +176,33 @@ class Creature:
         self.slow_factor = factor
         self.color = (100, 150, 255)  # Icy blue
 
+    def clear_attack_cooldowns(self):
+        self.contact_attack_times.clear()
+
     def take_damage(self, amount):
         self.hp -= amount
         self.set_animation_state('hurt')
         self.hurt_time = pygame.time.get_ticks()
 
-    def perform_action_attack(self, players):
-        if not self.action_type or not self.action_fx:
-            return
-            
-        now = pygame.time.get_ticks()
-        if now - self.last_cleave_time < self.cleave_cooldown:
-            return
-            
-        # Find nearest player
-        nearest_player = None
-        min_dist = float('inf')
-        for player in players:
-            if not player.dead:
-                dist = math.hypot(player.rect.centerx - self.rect.centerx, player.rect.centery - self.rect.centery)
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest_player = player
-        
-        if nearest_player and min_dist <= self.cleave_range * 2:
-            # Start action attack
-            self.is_cleaving = True
-            self.cleave_start_time = now
-            self.last_cleave_time = now
-            # Calculate angle to player for cleave effect
-            dx = nearest_player.rect.centerx - self.rect.centerx
-            dy = nearest_player.rect.centery - self.rect.centery
-            self.cleave_angle = math.degrees(math.atan2(dy, dx))
-            # Simple attack area check (semi-circle in facing direction)
-            if self.facing == 'right' and dx > 0 and abs(dy) < self.cleave_range:
-                if hasattr(nearest_player, 'take_damage'):
-                    nearest_player.take_damage(self.damage)
-            elif self.facing == 'left' and dx < 0 and abs(dy) < self.cleave_range:
-                if hasattr(nearest_player, 'take_damage'):
-                    nearest_player.take_damage(self.damage)
+    def action_attack_ready(self, now):
+        return bool(self.action_type and self.action_fx) and now - self.last_cleave_time >= self.cleave_cooldown
+
+    def start_action_attack(self, target, now):
+        """Begin an action attack (cleave) toward `target`, damaging it if it is in the swing arc."""
+        self.is_cleaving = True
+        self.cleave_start_time = now
+        self.last_cleave_time = now
+        # Calculate angle to player for cleave effect
+        dx = target.rect.centerx - self.rect.centerx
+        dy = target.rect.centery - self.rect.centery
+        self.cleave_angle = math.degrees(math.atan2(dy, dx))
+        # Simple attack area check (semi-circle in facing direction)
+        if self.facing == 'right' and dx > 0 and abs(dy) < self.cleave_range:
+            if hasattr(target, 'take_damage'):
+                target.take_damage(self.damage)
+        elif self.facing == 'left' and dx < 0 and abs(dy) < self.cleave_range:
+            if hasattr(target, 'take_damage'):
+                target.take_damage(self.damage)
 
     def update(self, dt, walls, players):
         # Handle knockback movement first
@@ -228,10 +230,29 @@ class Creature:
                     self.knockback_dy *= -0.5
             self.knockback_dx *= self.knockback_friction
             self.knockback_dy *= self.knockback_friction
+
+        # Cleave and hurt states expire every tick, whatever the AI rate, so a creature
+        # in a slow band does not stay mid-swing or flinching
+        if self.is_cleaving and self.cleave_start_time:
+            if pygame.time.get_ticks() - self.cleave_start_time > self.cleave_duration:
+                self.is_cleaving = False
+                self.cleave_start_time = None
+        
+        # Handle hurt animation state
+        if self.animation_state == 'hurt' and self.hurt_time is not None:
+            if pygame.time.get_ticks() - self.hurt_time > self.hurt_duration:
+                self.set_animation_state('walk')
+                self.hurt_time = None
+
+        # Distant creatures only think every few ticks and then catch up in one step
+        steps = AI_LOD.steps_due(self)
+        if not steps:
+            return
+        self.step_scale = steps
         
         # Update slow effect
         if self.slow_duration > 0:
-            self.slow_duration -= dt * 1000
+            self.slow_duration -= dt * 1000 * steps
             if self.slow_duration <= 0:
                 self.slow_factor = 1.0
                 self.color = self.original_color if hasattr(self, 'original_color') else self.color
@@ -241,25 +262,14 @@ class Creature:
         if self.movement_profile:
             self.movement_profile.move(self, players)
         
-        # Handle action attacks (melee/ranged)
-        if self.action_type:
-            self.perform_action_attack(players)
-        elif self.attack_profile:
-            self.attack_profile.execute(self, players)
+        # Action attacks (melee/ranged) and contact damage are resolved for all
+        # creatures at once by resolve_creature_contacts after movement
         
         self.rect.topleft = (self.x, self.y)
-        
-        # Handle cleave animation
-        if self.is_cleaving and self.cleave_start_time:
-            if pygame.time.get_ticks() - self.cleave_start_time > self.cleave_duration:
-                self.is_cleaving = False
-                self.cleave_start_time = None
-        
-        # Handle hurt animation state
-        if self.animation_state == 'hurt' and self.hurt_time is not None:
-            if pygame.time.get_ticks() - self.hurt_time > self.hurt_duration:
-                self.set_animation_state('walk')
-                self.hurt_time = None
+
+        # Far creatures skip turning to face a player
+        if self.lod_interval > 1:
+            return
         
         # --- New: Update facing based on nearest player (for subclasses that want it) ---
         if hasattr(self, 'update_facing_nearest_player') and callable(self.update_facing_nearest_player):
@@ -277,19 +287,55 @@ class Creature:
                 dx = nearest_player.rect.centerx - self.rect.centerx
                 self.facing = 'right' if dx > 0 else 'left'
 
-    def draw(self, surface, camera_x, camera_y, game_x, game_y):
+    def sprite_blits(self, screen_x, screen_y):
+        """
+        Blit tuples for Surface.blits drawing this creature at (screen_x, screen_y): the
+        cleave effect if active, then the current sprite. Sources come from CREATURE_ATLAS
+        when it holds them, so nothing is rotated or allocated per frame.
+        """
+        blits = []
+        # Cleave effect if active
+        if self.is_cleaving and hasattr(self, 'action_image'):
+            center = (screen_x + self.rect.width // 2, screen_y + self.rect.height // 2)
+            rotation = -getattr(self, 'cleave_angle', 0) - 110
+            frame = None
+            if self.action_atlas_key:
+                frame = CREATURE_ATLAS.get(self.action_atlas_key + (rotation_frame(rotation),))
+            if frame:
+                page, area = frame
+                blits.append((page, (center[0] - area.width // 2, center[1] - area.height // 2), area))
+            elif self.action_atlas_key:
+                rotated_img = pygame.transform.rotate(self.action_image, rotation)
+                blits.append((rotated_img, rotated_img.get_rect(center=center).topleft))
+            else:
+                # Placeholder effects are plain circles, rotating them changes nothing
+                blits.append((self.action_image, self.action_image.get_rect(center=center).topleft))
+        key = f'{self.animation_state}_{self.facing}'
+        frame = CREATURE_ATLAS.get(self.atlas_keys.get(key))
+        if frame:
+            page, area = frame
+            blits.append((page, (screen_x, screen_y), area))
+        else:
+            img = self.images.get(key)
+            if img:
+                blits.append((img, (screen_x, screen_y)))
+        return blits
+
+    def draw(self, surface, camera_x, camera_y, game_x, game_y, batch=None):
+        """
+        Draw the creature. With `batch`, its sprite blits are appended to the list for one
+        Surface.blits call and the HP bar is left to draw_hp_bar (see draw_creatures).
+        """
         screen_x = self.rect.x - camera_x + game_x
         screen_y = self.rect.y - camera_y + game_y
-        # Draw cleave effect if active
-        if self.is_cleaving and hasattr(self, 'action_image'):
-            angle = getattr(self, 'cleave_angle', 0)
-            rotated_img = pygame.transform.rotate(self.action_image, -angle - 110)
-            rect = rotated_img.get_rect(center=(screen_x + self.rect.width // 2, screen_y + self.rect.height // 2))
-            surface.blit(rotated_img, rect.topleft)
-        img = self.get_current_image()
-        if img:
-            surface.blit(img, (screen_x, screen_y))
-        # Draw HP bar
+        blits = self.sprite_blits(screen_x, screen_y)
+        if batch is not None:
+            batch.extend(blits)
+            return
+        surface.blits(blits, doreturn=False)
+        self.draw_hp_bar(surface, screen_x, screen_y)
+
+    def draw_hp_bar(self, surface, screen_x, screen_y):
         hp_bar_width = self.width
         hp_bar_height = 4
         hp_ratio = max(0, self.hp / self.max_hp)
@@ -297,11 +343,12 @@ class Creature:
         pygame.draw.rect(surface, (0, 255, 0), (screen_x, screen_y - 6, hp_bar_width * hp_ratio, hp_bar_height))
 
 class ZombieCat(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/zombie_cat/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/zombie_cat/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/zombie_cat/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/zombie_cat/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -309,9 +356,9 @@ class ZombieCat(Creature):
             hp=30,
             damage=5,
             speed=3,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -337,7 +384,7 @@ class ToughZombieCat(Creature):
             hp=80,
             damage=12,
             speed=2,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=800),
             color=(120, 80, 80)
         )
@@ -366,7 +413,7 @@ class ThornyVenomThistle(Creature):
 
     def update(self, dt, walls, players):
         # Stationary, but can attack players in range
-        if self.hp <= 0:
+        if self.hp <= 0 or not AI_LOD.steps_due(self):
             return
         now = pygame.time.get_ticks()
         for player in players:
@@ -379,11 +426,14 @@ class ThornyVenomThistle(Creature):
                             player.take_damage(self.damage)
                         self.last_attack_time = now
 
-    def draw(self, surface, camera_x, camera_y, game_x, game_y):
+    def draw(self, surface, camera_x, camera_y, game_x, game_y, batch=None):
         screen_x = self.rect.x - camera_x + game_x
         screen_y = self.rect.y - camera_y + game_y
         pygame.draw.rect(surface, self.color, (screen_x, screen_y, self.rect.width, self.rect.height))
-        # Draw HP bar
+        if batch is None:
+            self.draw_hp_bar(surface, screen_x, screen_y)
+
+    def draw_hp_bar(self, surface, screen_x, screen_y):
         hp_bar_width = self.rect.width
         hp_bar_height = 4
         hp_ratio = max(0, self.hp / self.max_hp)
@@ -391,11 +441,12 @@ class ThornyVenomThistle(Creature):
         pygame.draw.rect(surface, (0, 255, 0), (screen_x, screen_y - 6, hp_bar_width * hp_ratio, hp_bar_height))
 
 class ZombieDog(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/zombie_dog/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/zombie_dog/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/zombie_dog/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/zombie_dog/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -403,9 +454,9 @@ class ZombieDog(Creature):
             hp=60,  # double HP
             damage=10,  # more damage
             speed=3,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -423,11 +474,12 @@ class ZombieDog(Creature):
         self.difficulty = 1
 
 class ZombieFemale(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/zombie_female/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/zombie_female/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/zombie_female/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/zombie_female/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -435,9 +487,9 @@ class ZombieFemale(Creature):
             hp=40,
             damage=8,
             speed=2.5,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -454,11 +506,12 @@ class ZombieFemale(Creature):
         self.difficulty = 2
 
 class ZombieMale(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/zombie_male/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/zombie_male/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/zombie_male/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/zombie_male/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -466,9 +519,9 @@ class ZombieMale(Creature):
             hp=40,
             damage=8,
             speed=2.5,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -485,11 +538,12 @@ class ZombieMale(Creature):
         self.difficulty = 2
 
 class NecroBat(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/necro_bat/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/necro_bat/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/necro_bat/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/necro_bat/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -497,9 +551,9 @@ class NecroBat(Creature):
             hp=20,
             damage=6,
             speed=4,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -516,11 +570,12 @@ class NecroBat(Creature):
         self.difficulty = 2
 
 class NecroMountainLion(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/necro_mountain_lion/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/necro_mountain_lion/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/necro_mountain_lion/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/necro_mountain_lion/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -528,9 +583,9 @@ class NecroMountainLion(Creature):
             hp=100,
             damage=20,
             speed=3.5,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -547,11 +602,12 @@ class NecroMountainLion(Creature):
         self.difficulty = 3
 
 class NecroApe(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/necro_ape/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/necro_ape/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/necro_ape/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/necro_ape/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -559,9 +615,9 @@ class NecroApe(Creature):
             hp=100,
             damage=20,
             speed=3.5,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -578,11 +634,12 @@ class NecroApe(Creature):
         self.difficulty = 3
 
 class CyberEnhancedZombie(Creature):
+    IMAGE_FILES = {
+        'walk': ('creatures/cyber_enhanced_zombie/walk.png', Orientation.RIGHT),
+        'hurt': ('creatures/cyber_enhanced_zombie/hurt.png', Orientation.RIGHT)
+    }
+
     def __init__(self, x, y, facing='right'):
-        image_files = {
-            'walk': ('creatures/cyber_enhanced_zombie/walk.png', Orientation.RIGHT),
-            'hurt': ('creatures/cyber_enhanced_zombie/hurt.png', Orientation.RIGHT)
-        }
         super().__init__(
             x=x,
             y=y,
@@ -590,9 +647,9 @@ class CyberEnhancedZombie(Creature):
             hp=200,
             damage=35,
             speed=4,
-            movement_profile=DirectApproach(),
+            movement_profile=CrowdApproach(),
             attack_profile=MeleeCollisionAttack(cooldown=1000),
-            image_files=image_files,
+            image_files=self.IMAGE_FILES,
             action_type='melee',
             action_fx=MELEE_ACTION_FX.CLEAVE,
             ability1=None,
@@ -0,0 +1,75 @@
+from enum import IntEnum
+
+
+class DamageSource(IntEnum):
+    HIT = 0      # direct bullet, beam and spray hits
+    SPLASH = 1   # explosions, damage falls off with distance
+    AREA = 2     # mines and orbital beams, flat damage over an area
+    BURN = 3
+    POISON = 4
+
+
+class DamageBuffer:
+    """
+    Collects the damage creatures take during a tick and applies it in one pass.
+
+    add() only grows creature.pending_damage and the running totals; creature.hp
+    changes in apply(), which the main loop calls once after every damage phase
+    (bullets, spray, burn and poison ticks) and before dead creatures are cleaned
+    up. Hit checks during the tick treat a creature as dead once its pending
+    damage reaches its hp (see is_alive), so later shots still pass through it.
+
+    Totals are kept per (source, weapon name, player) for balance and performance
+    tuning; report() lists them, heaviest first.
+    """
+    def __init__(self):
+        self.damaged = []  # creatures with pending damage this tick
+        self.totals = {}   # (source, weapon, player) -> [damage, hits]
+
+    def add(self, creature, amount, source, weapon=None, player=None, hits=1):
+        if not creature.pending_damage:
+            self.damaged.append(creature)
+        creature.pending_damage += amount
+        key = (source, weapon, player)
+        total = self.totals.get(key)
+        if total is None:
+            self.totals[key] = [amount, hits]
+        else:
+            total[0] += amount
+            total[1] += hits
+
+    def apply(self):
+        """Subtract every creature's pending damage from its hp; cleanup_dead_creatures removes the dead."""
+        for creature in self.damaged:
+            creature.hp -= creature.pending_damage
+            creature.pending_damage = 0
+        self.damaged.clear()
+
+    def reset(self):
+        for creature in self.damaged:
+            creature.pending_damage = 0
+        self.damaged.clear()
+        self.totals.clear()
+
+    def report(self):
+        rows = []
+        for (source, weapon, player), (damage, hits) in self.totals.items():
+            character = getattr(player, 'character', None)
+            rows.append({
+                'source': source.name.lower(),
+                'weapon': weapon,
+                'player': getattr(character, 'name', None),
+                'damage': damage,
+                'hits': hits,
+            })
+        rows.sort(key=lambda row: row['damage'], reverse=True)
+        return rows
+
+
+def is_alive(creature):
+    """Alive for hit checks within a tick: hp left after the damage already dealt this tick."""
+    return creature.hp > creature.pending_damage
+
+
+# Shared damage buffer; combat helpers add to it and the main loop applies it once per tick
+DAMAGE = DamageBuffer()
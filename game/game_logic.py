@@ -83,23 +83,25 @@ def award_xp_shared(players, total_xp, alive_only=False):
 
 def cleanup_dead_creatures(creatures, players):
     """
-    Award XP for dead creatures and remove them from the list.
+    Award XP for dead creatures and remove them from the list in a single
+    compaction pass. XP from every kill this tick is summed and shared once.
     Returns number of creatures removed (optional).
     """
-    removed = 0
-    i = 0
-    while i < len(creatures):
-        c = creatures[i]
-        if c.hp <= 0:
-            # Award XP once
-            if not getattr(c, "xp_awarded", False):
-                xp = getattr(c, "xp_value", 0)
-                award_xp_shared(players, xp, alive_only=False)  # flip to False if you want everyone to share
-                c.xp_awarded = True
-
-            # Remove creature
-            creatures.pop(i)
-            removed += 1
+    xp = 0
+    keep = 0
+    for c in creatures:
+        if c.hp > 0:
+            # Compact survivors to the front
+            creatures[keep] = c
+            keep += 1
             continue
-        i += 1
+        # Award XP once
+        if not c.xp_awarded:
+            xp += c.xp_value
+            c.xp_awarded = True
+        c.clear_attack_cooldowns()
+    removed = len(creatures) - keep
+    if removed:
+        del creatures[keep:]
+        award_xp_shared(players, xp, alive_only=False)  # flip to True if only living players should share
     return removed
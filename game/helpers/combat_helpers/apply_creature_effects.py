@@ -4,14 +4,23 @@ import pygame
 from game.weapons import EnemyContactEffect
 from game.weapons import ContactEffect
 from game.helpers.combat_helpers.apply_poison import apply_poison
+from game.projectiles import ProjectileKind
+from game.damage import DAMAGE, DamageSource
 
-def apply_creature_effects(bullet, creature):
-    """Apply all enemy effects from a bullet to a creature."""
+def apply_creature_effects(bullet, creature, hits=1, source=DamageSource.HIT):
+    """
+    Apply all enemy effects from a bullet to a creature.
+    `hits` folds several hits by identical projectiles in one tick into a single call:
+    damage is multiplied and each poison hit still adds its stack. Burn and slow refresh
+    once, and knockback is applied once because it sets the creature's knockback
+    velocity rather than adding to it, so repeated hits in a tick never pushed harder.
+    Damage goes into DAMAGE and lands on creature.hp when the tick's damage is applied.
+    """
     # Always apply direct damage first
-    creature.hp -= bullet['damage']
+    DAMAGE.add(creature, bullet.damage * hits, source, bullet.weapon_name, bullet.owner, hits)
     
     # Apply each enemy effect
-    for effect in bullet['enemy_effects']:
+    for effect in bullet.enemy_effects:
         if effect == EnemyContactEffect.PHYSICAL:
             continue  # Physical damage already applied
             
@@ -21,11 +30,13 @@ def apply_creature_effects(bullet, creature):
                 creature.burning_effects = {}
             # Add or refresh burning effect
             creature.burning_effects[id(creature)] = {
-                'damage': bullet.get('burn_damage', bullet['damage'] * 0.3),  # 30% of base damage as burn
+                'damage': bullet.burn_damage if bullet.burn_damage is not None else bullet.damage * 0.3,  # 30% of base damage as burn
                 'duration': 3.0,
                 'tick_rate': 0.5,
                 'start_time': pygame.time.get_ticks(),
-                'last_tick': pygame.time.get_ticks()
+                'last_tick': pygame.time.get_ticks(),
+                'weapon': bullet.weapon_name,
+                'owner': bullet.owner
             }
             
         elif effect == EnemyContactEffect.ICE:
@@ -33,11 +44,12 @@ def apply_creature_effects(bullet, creature):
                 creature.apply_slow(duration=3000, factor=0.5)
                 
         elif effect == EnemyContactEffect.POISON:
-            apply_poison(creature, bullet['damage'])
+            for _ in range(min(hits, 4)):  # apply_poison caps at 4 stacks
+                apply_poison(creature, bullet.damage, bullet.weapon_name, bullet.owner)
             
         elif effect == EnemyContactEffect.KNOCKBACK:
             # Skip knockback for beam weapons
-            if bullet.get('type') == 'beam':
+            if bullet.kind == ProjectileKind.BEAM:
                 continue
 
             # Initialize knockback attributes if they don't exist
@@ -46,16 +58,16 @@ def apply_creature_effects(bullet, creature):
                 creature.knockback_dy = 0
                 creature.knockback_resistance = getattr(creature, 'knockback_resistance', 1.0)
 
-            knockback_force = bullet.get('knockback_force', 10)  # Default force if not specified
+            knockback_force = bullet.knockback_force
             
-            if bullet.get('is_orbital_beam') or bullet.get('contact_effect') == ContactEffect.EXPLODE:
+            if bullet.kind == ProjectileKind.ORBITAL_BEAM or bullet.contact_effect == ContactEffect.EXPLODE:
                 # Knockback from center point for explosions and orbital beams
-                dx = creature.rect.centerx - bullet['x']
-                dy = creature.rect.centery - bullet['y']
+                dx = creature.rect.centerx - bullet.x
+                dy = creature.rect.centery - bullet.y
             else:
                 # Knockback in bullet's direction for regular bullets
-                dx = bullet['dx']
-                dy = bullet['dy']
+                dx = bullet.dx
+                dy = bullet.dy
             
             # Normalize direction vector
             length = math.sqrt(dx * dx + dy * dy)
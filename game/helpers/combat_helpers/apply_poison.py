@@ -1,7 +1,7 @@
 import pygame
 
 
-def apply_poison(creature, base_damage):
+def apply_poison(creature, base_damage, weapon=None, owner=None):
     if not hasattr(creature, 'poison_effects'):
         creature.poison_effects = []
 
@@ -24,7 +24,9 @@ def apply_poison(creature, base_damage):
         'duration': 20000,  # 20 seconds
         'tick_rate': 1000,   # 1 second
         'start_time': pygame.time.get_ticks(),
-        'last_tick': pygame.time.get_ticks()
+        'last_tick': pygame.time.get_ticks(),
+        'weapon': weapon,
+        'owner': owner
     }
     creature.poison_effects.append(new_effect)
 
@@ -0,0 +1,41 @@
+import math
+
+from game.helpers.combat_helpers.apply_creature_effects import apply_creature_effects
+from game.damage import DAMAGE, DamageSource, is_alive
+
+# Splash damage per ring, innermost ring first; rings split the radius evenly
+SPLASH_FALLOFF = (20, 16, 12, 8, 2)
+
+
+def query_area(creature_grid, x, y, radius):
+    """
+    Return (creature, distance) pairs for living creatures whose center is within
+    `radius` of (x, y). Only grid cells overlapping the circle are visited.
+    """
+    return [(creature, dist) for creature, dist in creature_grid.query_radius(x, y, radius) if is_alive(creature)]
+
+
+def apply_falloff_damage(hits, radius, falloff=SPLASH_FALLOFF, weapon=None, player=None):
+    """Damage each (creature, distance) hit by the falloff ring its distance falls in."""
+    rings = len(falloff)
+    add = DAMAGE.add
+    if radius <= 0:
+        for creature, _ in hits:
+            add(creature, falloff[0], DamageSource.SPLASH, weapon, player)
+        return
+    scale = rings / radius
+    for creature, dist in hits:
+        ring = max(0, math.ceil(dist * scale) - 1)
+        add(creature, falloff[min(ring, rings - 1)], DamageSource.SPLASH, weapon, player)
+
+
+def apply_area_damage(hits, damage, weapon=None, player=None):
+    """Deal the same flat damage to every hit."""
+    for creature, _ in hits:
+        DAMAGE.add(creature, damage, DamageSource.AREA, weapon, player)
+
+
+def apply_area_effects(hits, bullet):
+    """Apply a bullet's full damage and enemy effects to every hit."""
+    for creature, _ in hits:
+        apply_creature_effects(bullet, creature, source=DamageSource.AREA)
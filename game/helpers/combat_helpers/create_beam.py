@@ -1,17 +1,25 @@
-def create_beam(x, y, angle, weapon):
+from collections import deque
+
+from game.projectiles import Beam
+
+# Trail points kept per beam; the oldest point drops off automatically
+BEAM_TRAIL_LENGTH = 20
+
+
+def create_beam(x, y, angle, weapon, owner=None):
     """Create a lightning-fast beam projectile"""
-    return {
-        'x': x,
-        'y': y,
-        'angle': angle,
-        'speed': weapon.common.bullet_speed,
-        'damage': weapon.common.damage,
-        'size': weapon.common.bullet_size,
-        'color': weapon.common.bullet_color,
-        'range': weapon.common.range * 32,  # Use weapon's actual range
-        'piercing': weapon.uncommon.piercing or 0,
-        'enemy_effects': weapon.common.enemy_effects,
-        'hits': set(),  # Track creatures hit to prevent multiple hits
-        'trail_points': [(x, y)],  # Store trail points for visual effect
-        'type': 'beam'
-    }
\ No newline at end of file
+    return Beam(
+        x=x,
+        y=y,
+        angle=angle,
+        speed=weapon.common.bullet_speed,
+        size=weapon.common.bullet_size,
+        damage=weapon.common.damage,
+        color=weapon.common.bullet_color,
+        range=weapon.common.range * 32,  # Use weapon's actual range
+        piercing=weapon.uncommon.piercing or 0,
+        enemy_effects=weapon.common.enemy_effects,
+        trail_points=deque([(x, y)], maxlen=BEAM_TRAIL_LENGTH),  # Ring buffer of trail points for visual effect
+        weapon_name=weapon.common.name,
+        owner=owner,
+    )
@@ -0,0 +1,51 @@
+import math
+import random
+
+from game.helpers.combat_helpers.create_bullet import create_bullet
+from game.projectiles import BULLET_POOL
+
+
+def create_shotgun_volley(player, weapon, weapon_index, tile_size=32, camera_x=0, camera_y=0):
+    """
+    Create every pellet of one shotgun shot in a single pass over the weapon's
+    precomputed pellet rotations, drawing the bullets from BULLET_POOL.
+
+    Returns:
+        List of Bullets, ready for bullets.extend()
+    """
+    template = weapon.shot_template(tile_size)
+    if not template.pellet_rotations:
+        return [create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y)]
+    base_dx, base_dy = player.aim_direction
+    x, y = player.rect.centerx, player.rect.centery
+    acquire = BULLET_POOL.acquire
+    return [acquire(template, x, y, base_dx * cos_spread - base_dy * sin_spread, base_dx * sin_spread + base_dy * cos_spread, weapon_index, player)
+            for cos_spread, sin_spread in template.pellet_rotations]
+
+
+def create_spray_volley(player, weapon, weapon_index, tile_size=32, camera_x=0, camera_y=0):
+    """
+    Create one spray shot: the shared template bullet plus (dx, dy, speed, size_scale,
+    phase) for each particle, as SprayParticleSystem.emit expects. The base angles
+    come from the weapon's ShotTemplate; only the jitter is drawn per particle.
+
+    Returns:
+        (template bullet, list of particle tuples)
+    """
+    template = weapon.shot_template(tile_size)
+    shot = create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y)
+    base_dx, base_dy = player.aim_direction
+    speed = template.speed
+    uniform = random.uniform
+    jitter = math.radians(5)
+    particles = []
+    for i, base_angle in enumerate(template.spray_angles):
+        spread_rad = base_angle + uniform(-jitter, jitter)
+        cos_spread = math.cos(spread_rad)
+        sin_spread = math.sin(spread_rad)
+        particles.append((base_dx * cos_spread - base_dy * sin_spread,
+                          base_dx * sin_spread + base_dy * cos_spread,
+                          speed * uniform(0.8, 1.2),
+                          uniform(0.7, 1.3) * uniform(0.8, 1.2),
+                          i))  # i: animation phase, see draw_spray_particles
+    return shot, particles
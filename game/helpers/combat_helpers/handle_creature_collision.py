@@ -1,4 +1,5 @@
 from game.helpers.combat_helpers.handle_piercing_collision import handle_piercing_collision
+from game.damage import is_alive
 
 
 
@@ -7,7 +8,7 @@ def handle_creature_collision(bullet, bullet_rect, creatures, players):
     Handle bullet collision with creatures, including piercing logic.
     
     Args:
-        bullet: Bullet dictionary
+        bullet: Bullet
         bullet_rect: Bullet rectangle for collision detection
         creatures: List of creature objects
         players: List of Player objects
@@ -18,14 +19,14 @@ def handle_creature_collision(bullet, bullet_rect, creatures, players):
     # Find all creatures that this bullet collides with
     hit_creatures = []
     for creature in creatures:
-        if creature.hp > 0 and bullet_rect.colliderect(creature.rect):
+        if is_alive(creature) and bullet_rect.colliderect(creature.rect):
             hit_creatures.append(creature)
     
     if not hit_creatures:
         return False
     
     # Handle splash damage
-    if bullet.get('splash'):
+    if bullet.splash:
         return True  # Bullet will be removed by caller
     
     # Handle piercing logic for all hit creatures
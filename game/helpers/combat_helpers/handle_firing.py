@@ -1,10 +1,12 @@
 import pygame
 import math
-import random
 
 from game.weapons import FireMode
 from game.helpers.combat_helpers.create_bullet import create_bullet
 from game.helpers.combat_helpers.create_beam import create_beam
+from game.helpers.combat_helpers.create_volley import create_shotgun_volley, create_spray_volley
+from game.spray_particles import SPRAY_PARTICLES
+from game.projectiles import Mine
 
 
 def handle_firing(players, indices, bullets, current_player_index=0, tile_size=32, camera_x=0, camera_y=0, ability_active=None, is_ability=False):
@@ -24,10 +26,9 @@ def handle_firing(players, indices, bullets, current_player_index=0, tile_size=3
             if player.ability_points >= ap_cost:
                 player.ability_points -= ap_cost
                 # Create mine bullet at player location
-                bullet = create_bullet(player, ability, ability_index, tile_size, camera_x, camera_y)
-                bullet['is_mine'] = True
-                bullet['trigger_radius'] = getattr(ability.uncommon, 'trigger_radius', 32)
-                bullet['splash'] = getattr(ability.uncommon, 'splash', 2.0)
+                bullet = create_bullet(player, ability, ability_index, tile_size, camera_x, camera_y, projectile_class=Mine)
+                bullet.trigger_radius = getattr(ability.uncommon, 'trigger_radius', 32)
+                bullet.splash = getattr(ability.uncommon, 'splash', 2.0)
                 bullets.append(bullet)
             # Reset ability_active so only one mine per press
             ability_active[0] = False
@@ -44,10 +45,9 @@ def handle_firing(players, indices, bullets, current_player_index=0, tile_size=3
         if player.ability_points >= ap_cost:
             player.ability_points -= ap_cost
             # Create mine bullet at player location
-            bullet = create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y)
-            bullet['is_mine'] = True
-            bullet['trigger_radius'] = getattr(weapon.uncommon, 'trigger_radius', 32)
-            bullet['splash'] = getattr(weapon.uncommon, 'splash', 2.0)
+            bullet = create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y, projectile_class=Mine)
+            bullet.trigger_radius = getattr(weapon.uncommon, 'trigger_radius', 32)
+            bullet.splash = getattr(weapon.uncommon, 'splash', 2.0)
             bullets.append(bullet)
         # Reset ability_active so only one mine per press
         ability_active[0] = False
@@ -65,32 +65,14 @@ def handle_firing(players, indices, bullets, current_player_index=0, tile_size=3
         if warm_up_elapsed < weapon.uncommon.warm_up_time:
             can_fire = False
     
-    fire_delay = 60000 / weapon.common.fire_rate  # ms per shot
+    fire_delay = weapon.shot_template(tile_size).fire_delay  # ms per shot
     if can_fire and now - weapon.last_shot_time >= fire_delay and weapon.current_clip > 0 and not weapon.is_reloading:
         # Create bullet(s)
         if weapon.common.fire_mode == FireMode.SHOTGUN:
-            for i in range(weapon.uncommon.volley or 1):
-                bullet = create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y, pellet_index=i)
-                bullets.append(bullet)
+            bullets.extend(create_shotgun_volley(player, weapon, weapon_index, tile_size, camera_x, camera_y))
         elif weapon.common.fire_mode == FireMode.SPRAY:
-            base_angle = math.atan2(player.aim_direction[1], player.aim_direction[0])
-            for i in range((weapon.uncommon.volley or 1) * 2):
-                spread_angle = ((weapon.uncommon.spread or 0) / ((weapon.uncommon.volley or 1) * 2 - 1)) * i - ((weapon.uncommon.spread or 0) / 2)
-                spread_angle += random.uniform(-5, 5)
-                spread_rad = math.radians(spread_angle)
-                cos_spread = math.cos(spread_rad)
-                sin_spread = math.sin(spread_rad)
-                dx = player.aim_direction[0] * cos_spread - player.aim_direction[1] * sin_spread
-                dy = player.aim_direction[0] * sin_spread + player.aim_direction[1] * cos_spread
-                speed_variation = random.uniform(0.8, 1.2)
-                bullet = create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y, pellet_index=i)
-                bullet['dx'] = dx
-                bullet['dy'] = dy
-                bullet['speed'] = weapon.common.bullet_speed * speed_variation
-                bullet['particle_variation'] = random.uniform(0, 2 * math.pi)
-                bullet['particle_size_variation'] = random.uniform(0.7, 1.3)
-                bullet['particle_intensity'] = random.uniform(0.8, 1.2)
-                bullets.append(bullet)
+            # Spray particles share one template per shot and live in the spray particle system
+            SPRAY_PARTICLES.emit(*create_spray_volley(player, weapon, weapon_index, tile_size, camera_x, camera_y))
         elif weapon.common.fire_mode == FireMode.ORBITAL:
             bullet = create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y)
             bullets.append(bullet)
@@ -99,7 +81,7 @@ def handle_firing(players, indices, bullets, current_player_index=0, tile_size=3
             bullets.append(bullet)
         elif weapon.common.fire_mode == FireMode.BEAM:
             # Handle beam weapons (lightning-fast piercing beam)
-            bullets.append(create_beam(player.rect.centerx, player.rect.centery, math.atan2(player.aim_direction[1], player.aim_direction[0]), weapon))
+            bullets.append(create_beam(player.rect.centerx, player.rect.centery, math.atan2(player.aim_direction[1], player.aim_direction[0]), weapon, player))
         else:
             bullet = create_bullet(player, weapon, weapon_index, tile_size, camera_x, camera_y)
             bullets.append(bullet)
@@ -1,31 +1,31 @@
 import pygame
-import math
 
+from game.helpers.combat_helpers.area_of_effect import query_area, apply_falloff_damage
+from game.spatial import SpatialHash
 
-def handle_splash_damage(bullet, creatures, splash_effects, tile_size=32):
+
+def handle_splash_damage(bullet, creatures, splash_effects, tile_size=32, creature_grid=None):
     """
     Handle splash damage from explosive bullets.
     
     Args:
-        bullet: Bullet dictionary
+        bullet: Exploding projectile
         creatures: List of creature objects
         splash_effects: List of splash effects
         tile_size: Size of tiles in pixels
+        creature_grid: SpatialHash of creatures (built from `creatures` if omitted)
     
     Returns:
         Updated splash_effects list
     """
-    splash_radius = bullet['splash'] * tile_size
-    center = (bullet['x'], bullet['y'])
-    splash_damages = [20, 16, 12, 8, 2]
+    if creature_grid is None:
+        creature_grid = SpatialHash()
+        creature_grid.rebuild(creatures)
+    splash_radius = bullet.splash * tile_size
+    center = (bullet.x, bullet.y)
     
-    for creature in creatures:
-        if creature.hp > 0:
-            dist = math.hypot(creature.rect.centerx - center[0], creature.rect.centery - center[1])
-            for i in range(5):
-                if dist <= splash_radius * (i+1)/5:
-                    creature.hp -= splash_damages[i]
-                    break
+    apply_falloff_damage(query_area(creature_grid, center[0], center[1], splash_radius), splash_radius,
+                         weapon=bullet.weapon_name, player=bullet.owner)
     
     # Add splash effect for visual
     splash_effects.append({'x': center[0], 'y': center[1], 'radius': splash_radius, 'start': pygame.time.get_ticks()})
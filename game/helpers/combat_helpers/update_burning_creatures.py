@@ -1,5 +1,7 @@
 import pygame
 
+from game.damage import DAMAGE, DamageSource
+
 def update_burning_creatures(creatures):
     """
     Update all burning creatures and apply damage over time.
@@ -24,7 +26,7 @@ def update_burning_creatures(creatures):
                 # Apply damage at tick rate intervals
                 time_since_last_tick = (current_time - effect['last_tick']) / 1000.0
                 if time_since_last_tick >= effect['tick_rate']:
-                    creature.hp -= effect['damage']
+                    DAMAGE.add(creature, effect['damage'], DamageSource.BURN, effect.get('weapon'), effect.get('owner'))
                     effect['last_tick'] = current_time
             
             # Remove expired effects
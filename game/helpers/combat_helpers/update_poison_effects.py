@@ -1,5 +1,7 @@
 import pygame
 
+from game.damage import DAMAGE, DamageSource
+
 
 def update_poison_effects(creatures):
     """
@@ -22,7 +24,7 @@ def update_poison_effects(creatures):
                 # Apply damage at tick rate intervals
                 time_since_last_tick = (current_time - effect['last_tick'])
                 if time_since_last_tick >= effect['tick_rate']:
-                    creature.hp -= effect['damage_per_tick']
+                    DAMAGE.add(creature, effect['damage_per_tick'], DamageSource.POISON, effect.get('weapon'), effect.get('owner'))
                     effect['last_tick'] = current_time
             
             # Remove expired effects by index, in reverse order to not mess up indices
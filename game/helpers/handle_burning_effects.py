@@ -5,7 +5,7 @@ def handle_burning_effects(bullet, creature, players):
     """
     Handle burning damage over time effects for flame weapons.
     """
-    if not bullet.get('is_flame') or EnemyContactEffect.FIRE not in bullet['enemy_effects']:
+    if not getattr(bullet, 'is_flame', False) or EnemyContactEffect.FIRE not in bullet.enemy_effects:
         return False
     
     creature_id = id(creature)
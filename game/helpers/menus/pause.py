@@ -142,9 +142,11 @@ def shift_time_references(players, creatures, bullets, paused_ms):
     for c in creatures:
         for attr in ("last_cleave_time", "cleave_start_time", "hurt_time"):
             _shift_attr(c, attr, paused_ms)
+        times = getattr(c, "contact_attack_times", None)
+        if times:
+            times[:] = [t + paused_ms for t in times]
     for b in bullets or []:
-        for attr in ("spawn_time", "created_at", "last_update", "explode_at"):
-            _shift_attr(b, attr, paused_ms)
+        b.shift_time(paused_ms)
 # --- Smoke layer (shared across all pause submenus) --------------------------
 import random, math, pygame
 
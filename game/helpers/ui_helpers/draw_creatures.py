@@ -2,10 +2,22 @@ import pygame
 import math
 
 
-def draw_creatures(screen, creatures, camera_x, camera_y, game_x, game_y, show_creature_hp):
-    """Draw all creatures and their HP bars."""
+def draw_creatures(screen, creatures, camera_x, camera_y, game_x, game_y, show_creature_hp, burn_density=1.0):
+    """
+    Draw all creatures and their HP bars.
+    burn_density scales how many flame, smoke and ember particles burning creatures get.
+    """
+    flame_clusters = max(1, round(3 * burn_density))
+    smoke_particles = round(4 * burn_density)
+    ember_particles = round(2 * burn_density)
+    # Every creature's sprites go out in one Surface.blits call, mostly from the atlas pages
+    batch = []
     for creature in creatures:
-        creature.draw(screen, camera_x, camera_y, game_x, game_y)
+        creature.draw(screen, camera_x, camera_y, game_x, game_y, batch)
+    screen.blits(batch, doreturn=False)
+
+    for creature in creatures:
+        creature.draw_hp_bar(screen, creature.rect.x - camera_x + game_x, creature.rect.y - camera_y + game_y)
         
         # Draw burning effects for creatures on fire
         if hasattr(creature, 'burning_effects') and creature.burning_effects:
@@ -15,8 +27,8 @@ def draw_creatures(screen, creatures, camera_x, camera_y, game_x, game_y, show_c
             current_time = pygame.time.get_ticks()
             
             # Create multiple flame clusters around the creature
-            for cluster in range(3):
-                cluster_angle = (current_time / 200 + cluster * 120) % 360
+            for cluster in range(flame_clusters):
+                cluster_angle = (current_time / 200 + cluster * 360 / flame_clusters) % 360
                 cluster_radius = 12 + (current_time / 300) % 8
                 cluster_x = cx + int(math.cos(math.radians(cluster_angle)) * cluster_radius)
                 cluster_y = cy + int(math.sin(math.radians(cluster_angle)) * cluster_radius)
@@ -53,7 +65,7 @@ def draw_creatures(screen, creatures, camera_x, camera_y, game_x, game_y, show_c
                     pygame.draw.circle(screen, (255, 120, 0), (tongue_x, tongue_y), max(1, int(flame_size * 0.3)))
             
             # Draw smoke particles rising from the creature
-            for smoke in range(4):
+            for smoke in range(smoke_particles):
                 smoke_angle = (current_time / 150 + smoke * 90) % 360
                 smoke_radius = 8 + (current_time / 400) % 6
                 smoke_x = cx + int(math.cos(math.radians(smoke_angle)) * smoke_radius)
@@ -68,7 +80,7 @@ def draw_creatures(screen, creatures, camera_x, camera_y, game_x, game_y, show_c
                     pygame.draw.circle(screen, (100, 100, 100), (smoke_x, smoke_y), smoke_size)
             
             # Draw ember particles floating around
-            for ember in range(2):
+            for ember in range(ember_particles):
                 ember_angle = (current_time / 100 + ember * 180) % 360
                 ember_radius = 15 + (current_time / 250) % 10
                 ember_x = cx + int(math.cos(math.radians(ember_angle)) * ember_radius)
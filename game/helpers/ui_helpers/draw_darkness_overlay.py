@@ -4,19 +4,24 @@ import math
 """Has two helper functions below for the drawing of the darkness overlay"""
 
 _light_cache = {}
-def draw_darkness_overlay(screen, darkness_alpha, lights=[]):
+def draw_darkness_overlay(screen, darkness_alpha, lights=[], resolution=1.0):
     """
     Draws a darkness overlay and subtracts radial or simple cone lights.
+    With resolution < 1 the lightmap is built at that fraction of the screen size and
+    smooth-scaled up, which is much cheaper and only softens the light edges.
     """
     if darkness_alpha <= 0:
         return
 
-    overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+    screen_size = screen.get_size()
+    size = (max(1, int(screen_size[0] * resolution)), max(1, int(screen_size[1] * resolution)))
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
     overlay.fill((0, 0, 0, darkness_alpha))
 
     for light in lights:
         if light['type'] == 'radial':
-            x, y, radius = light['x'], light['y'], light['radius']
+            x, y = light['x'] * resolution, light['y'] * resolution
+            radius = max(1, int(light['radius'] * resolution))
             key = (radius, darkness_alpha)
             if key not in _light_cache:
                 _light_cache[key] = create_radial_light_surface(radius, darkness_alpha)
@@ -26,14 +31,16 @@ def draw_darkness_overlay(screen, darkness_alpha, lights=[]):
         elif light['type'] == 'cone':
             draw_flashlight_cone(
                 overlay,
-                x=light['x'],
-                y=light['y'],
+                x=light['x'] * resolution,
+                y=light['y'] * resolution,
                 angle_deg=light['angle'],
-                length=light['radius'],
+                length=light['radius'] * resolution,
                 spread_deg=light.get('spread', 45),
                 darkness_alpha=darkness_alpha
             )
 
+    if size != screen_size:
+        overlay = pygame.transform.smoothscale(overlay, screen_size)
     screen.blit(overlay, (0, 0))
 
     
@@ -1,9 +1,11 @@
 
 import pygame
 
+from game.asset_cache import get_font
+
 def draw_game_over(screen, screen_width, screen_height):
     """Draw the game over screen."""
-    font = pygame.font.Font(None, 72)
+    font = get_font(None, 72)
     text = font.render("GAME OVER", True, (255, 0, 0))
     screen.blit(text, (screen_width // 2 - text.get_width() // 2, screen_height // 2 - text.get_height() // 2))
     pygame.display.flip()
@@ -0,0 +1,18 @@
+import pygame
+
+from game.asset_cache import get_font
+
+
+def draw_loading_screen(screen, screen_width, screen_height, progress):
+    """Draw the asset loading screen with a progress bar (progress in 0..1)."""
+    screen.fill((0, 0, 0))
+    font = get_font(None, 36)
+    text = font.render(f"Loading... {int(progress * 100)}%", True, (200, 200, 200))
+    screen.blit(text, (screen_width // 2 - text.get_width() // 2, screen_height // 2 - text.get_height() - 12))
+
+    bar_width = screen_width // 3
+    bar_height = 10
+    bar_x = screen_width // 2 - bar_width // 2
+    bar_y = screen_height // 2
+    pygame.draw.rect(screen, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height), border_radius=2)
+    pygame.draw.rect(screen, (0, 255, 180), (bar_x, bar_y, int(bar_width * progress), bar_height), border_radius=2)
@@ -0,0 +1,71 @@
+import math
+import pygame
+
+# Animation frames per particle sprite; one cycle is 2*pi of the old time_offset (~630 ms)
+SPRAY_FRAMES = 16
+SPRAY_FRAME_MS = 628 // SPRAY_FRAMES
+
+_spray_sprite_cache = {}
+
+
+def draw_spray_particles(screen, particles, camera_x, camera_y, game_x, game_y):
+    """
+    Draw a SprayParticleSystem (flamethrower, ice, poison) in a single Surface.blits call.
+    Each particle shows a pre-rendered frame for its (color, size bucket); the frame is
+    the global animation frame offset by the particle's phase index.
+    """
+    frame_now = pygame.time.get_ticks() // SPRAY_FRAME_MS
+    templates = particles.templates
+    blits = []
+    for t, x, y, size_scale, phase in zip(particles.template, particles.x, particles.y, particles.size_scale, particles.phase):
+        template = templates[t]
+        frames = get_spray_frames(tuple(template.color), int(template.size * size_scale))
+        frame = frames[(frame_now + phase) % SPRAY_FRAMES]
+        half = frame.get_width() // 2
+        blits.append((frame, (int(x - camera_x + game_x) - half, int(y - camera_y + game_y) - half)))
+    screen.blits(blits, doreturn=False)
+
+
+def get_spray_frames(base_color, size_bucket):
+    key = (base_color, size_bucket)
+    if key not in _spray_sprite_cache:
+        _spray_sprite_cache[key] = [create_spray_frame(base_color, size_bucket, k) for k in range(SPRAY_FRAMES)]
+    return _spray_sprite_cache[key]
+
+
+def create_spray_frame(base_color, size_bucket, k):
+    """
+    Render animation frame `k` of a spray particle: a three-layer gradient body and two
+    flame tongues, flickering over the cycle.
+    """
+    # Big enough for the body at full flicker plus the longest tongue and its wobble
+    half = int(size_bucket * 2.1) + 4
+    surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    r, g, b = base_color
+    bright_color = (min(255, r + 60), min(255, g + 60), min(255, b + 60))
+    dark_color = (max(0, r - 40), max(0, g - 40), max(0, b - 40))
+
+    time_offset = 2 * math.pi * k / SPRAY_FRAMES
+    flicker = 0.8 + 0.4 * math.sin(time_offset * 3) * math.cos(time_offset * 2)
+    base_size = int(size_bucket * flicker)
+
+    # Main particle body with gradient effect
+    for i, color in enumerate((bright_color, base_color, dark_color)):
+        layer_size = base_size - i * 2
+        if layer_size <= 0:
+            break
+        offset_x = int(math.sin(time_offset + i) * 2)
+        offset_y = int(math.cos(time_offset + i * 0.7) * 2)
+        pygame.draw.circle(surface, color, (half + offset_x, half + offset_y), layer_size)
+
+    # Particle tongues
+    for tongue in range(2):
+        tongue_angle = time_offset * 0.5 + tongue * math.pi
+        tongue_length = base_size * (0.8 + 0.4 * math.sin(time_offset * 2))
+        tongue_x = half + int(math.cos(tongue_angle) * tongue_length)
+        tongue_y = half + int(math.sin(tongue_angle) * tongue_length)
+        tongue_size = max(1, int(base_size * 0.4 * flicker))
+        pygame.draw.circle(surface, bright_color, (tongue_x, tongue_y), tongue_size)
+        pygame.draw.circle(surface, base_color, (tongue_x, tongue_y), tongue_size - 1)
+
+    return surface
@@ -2,6 +2,8 @@ import pygame
 import math
 import os
 
+from game.asset_cache import get_font
+
 
 def draw_stats_ui(screen, players, player_start_pos, current_max_distance, start_ticks, stats, tile_size, border_size, top_menu_height, white):
     """Draw the stats UI in the top menu."""
@@ -11,11 +13,8 @@ def draw_stats_ui(screen, players, player_start_pos, current_max_distance, start
     
     current_game_time_seconds = (pygame.time.get_ticks() - start_ticks) / 1000
     
-    try:
-        font_size = int(top_menu_height * 0.25)
-        font = pygame.font.Font(os.path.join('assets', 'fonts', 'Creepster-Regular.ttf'), font_size)
-    except FileNotFoundError:
-        font = pygame.font.Font(None, int(top_menu_height * 0.25))
+    font_size = int(top_menu_height * 0.25)
+    font = get_font(os.path.join('assets', 'fonts', 'Creepster-Regular.ttf'), font_size)
     
     def format_time(seconds):
         mins = int(seconds // 60)
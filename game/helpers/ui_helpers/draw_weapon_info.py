@@ -1,9 +1,11 @@
 import pygame
 
+from game.asset_cache import get_font
+
 
 def draw_weapon_info(screen, weapon, x, y):
     """Draw weapon information on the screen."""
-    font = pygame.font.Font(None, 20)
+    font = get_font(None, 20)
     # Common stats
     text = f"DMG: {weapon.common.damage} | ACC: {weapon.common.accuracy} | CLIP: {weapon.common.clip_size} | RATE: {weapon.common.fire_rate}"
     info_surface = font.render(text, True, (255,255,255))
@@ -9,10 +9,22 @@ from game.characters import TESTY
 from game.creatures import create_zombie_cat, create_tough_zombie_cat, create_thorny_venom_thistle, CREATURE_DIFFICULTY_POOLS
 from game.combat import handle_firing, reset_warm_up, update_bullets, update_burning_creatures, update_poison_effects
 from game.player import Player
-from game.ui import draw_world, draw_creatures, draw_bullets, draw_splash_effects, draw_stats_ui, draw_xp_bar, draw_game_over, draw_darkness_overlay
+from game.ui import draw_world, draw_creatures, draw_bullets, draw_splash_effects, draw_stats_ui, draw_xp_bar, draw_game_over, draw_darkness_overlay, draw_loading_screen, draw_spray_particles
 from game.input_handler import handle_events, get_player_movement, is_fire_pressed
 from game.game_logic import update_players, handle_revival, apply_tether_mechanic, update_camera, cleanup_dead_creatures
 from game.helpers.menus.pause import pause_loop, shift_time_references
+from game.ai.contact import resolve_creature_contacts
+from game.ai.crowd import update_crowd_steering
+from game.ai.flow_field import FLOW_FIELD
+from game.ai.lod import AI_LOD
+from game.spatial import SpatialHash, WallGrid
+from game.spray_particles import SPRAY_PARTICLES
+from game.projectiles import ProjectileGroups
+from game.damage import DAMAGE
+from game.region_manager import RegionManager
+from game.spawn_director import SpawnDirector
+from game.quality_governor import QualityGovernor
+from game.asset_manager import AssetManager
 pygame.init()
 
 
@@ -51,7 +63,22 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("In The Dark - Simple Pygame Starter")
 clock = pygame.time.Clock()
 
+def load_assets():
+    """Show the loading screen until every spawnable creature's assets are in memory."""
+    assets = AssetManager(CREATURE_DIFFICULTY_POOLS)
+    while not assets.done:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        assets.process()
+        draw_loading_screen(screen, SCREEN_WIDTH, SCREEN_HEIGHT, assets.progress)
+        pygame.display.flip()
+        clock.tick(60)
+
+
 def main():
+    load_assets()
     world = World(seed=123)
     stats = GameStats()
     player_start_pos = (TILE_SIZE, TILE_SIZE)
@@ -62,14 +89,17 @@ def main():
     player_ability_indices = [0, 0]
     caps_lock_on = [False]
     creatures = []
+    creature_grid = SpatialHash(cell_size=TILE_SIZE * 2)
+    region_manager = RegionManager(TILE_SIZE, sleep_distance=max(GAME_WIDTH, GAME_HEIGHT) * 1.5, wake_distance=max(GAME_WIDTH, GAME_HEIGHT))
     
-    spawn_timer = 0
-    spawn_interval = 5000 
-    min_spawn_distance = TILE_SIZE * 6 
+    quality = QualityGovernor()
+    AI_LOD.set_viewport(GAME_WIDTH, GAME_HEIGHT)
+    spawn_director = SpawnDirector(TILE_SIZE, min_distance=TILE_SIZE * 6, max_distance=TILE_SIZE * 15)
     start_ticks = pygame.time.get_ticks()
     running = True
     camera_x, camera_y = 0, 0
-    bullets = []
+    bullets = ProjectileGroups()
+    DAMAGE.reset()
     show_creature_hp = False
     splash_effects = []
     current_max_distance = 0
@@ -102,39 +132,39 @@ def main():
         
         now = pygame.time.get_ticks()
         elapsed = now - start_ticks
-        minutes = elapsed // 60000
-        spawn_interval = max(300, 5000 // (2 ** minutes))  
-        if now - spawn_timer > spawn_interval:
-            
-            px, py = players[0].rect.center
-            for _ in range(100):  
-                x = random.randint(TILE_SIZE * 2, TILE_SIZE * 15)
-                y = random.randint(TILE_SIZE * 2, TILE_SIZE * 15)
-                if math.hypot(x - px, y - py) >= min_spawn_distance:
-                    
-                    pool_index = 0 if minutes < 1 else 1
-                    pool = CREATURE_DIFFICULTY_POOLS[pool_index] # JAKE CHANGE THIS TO POOL_INDEX AFTER TESTING or 3 FOR TESTING
-                    creature_class, kwargs = random.choice(pool)
-                    creatures.append(creature_class(x=x, y=y, **kwargs))
-                    break
-            spawn_timer = now
+        quality.record(clock.get_rawtime(), now)
+        spawn_director.rate_scale = quality.settings['spawn_rate']
+        AI_LOD.band_scale = quality.settings['lod_band_scale']
+        spawn_director.update(creatures, players, world, now, elapsed, clock.get_rawtime())
+        region_manager.update(creatures, players, now, spawn_director.creature_cap)
 
         clock.tick(60)
         current_game_time_seconds = (pygame.time.get_ticks() - start_ticks) / 1000
         day_phase, darkness_alpha = get_day_phase(current_game_time_seconds)
         visible_walls = draw_world(screen, world, camera_x, camera_y, GAME_X, GAME_Y, TILE_SIZE, BORDER_COLOR, MENU_COLOR, BLACK,  darkness_alpha)
+        wall_grid = WallGrid.from_rects(visible_walls, TILE_SIZE)
         all_dead = update_players(players, dx1, dy1, dx2, dy2, visible_walls, camera_x, camera_y, player_weapon_indices, GAME_X, GAME_Y)
         handle_revival(players, clock)
 
+        FLOW_FIELD.update(players, world, TILE_SIZE, (camera_x + GAME_WIDTH // 2, camera_y + GAME_HEIGHT // 2))
+        AI_LOD.begin_tick(players, creatures)
+        # Steering reads last tick's creature grid; it is rebuilt below once everyone has moved
+        update_crowd_steering(creatures, creature_grid, wall_grid)
         for creature in creatures:
             creature.update(1/60, visible_walls, players)
-        draw_creatures(screen, creatures, camera_x, camera_y, GAME_X, GAME_Y, show_creature_hp)
-        cleanup_dead_creatures(creatures, players)
-        bullets, splash_effects = update_bullets(bullets, creatures, visible_walls, 1/60, camera_x, camera_y)
+        creature_grid.rebuild(creatures)
+        resolve_creature_contacts(players, creature_grid)
+        draw_creatures(screen, creatures, camera_x, camera_y, GAME_X, GAME_Y, show_creature_hp, quality.settings['burn_density'])
+        bullets, splash_effects = update_bullets(bullets, creatures, visible_walls, 1/60, camera_x, camera_y, wall_grid=wall_grid, creature_grid=creature_grid)
+        SPRAY_PARTICLES.update(wall_grid, creature_grid)
         update_burning_creatures(creatures)
         update_poison_effects(creatures)
+        # Every damage phase has run; land the tick's damage, then clear out the dead
+        DAMAGE.apply()
+        cleanup_dead_creatures(creatures, players)
         draw_splash_effects(screen, splash_effects, camera_x, camera_y, GAME_X, GAME_Y)
-        draw_bullets(screen, bullets, camera_x, camera_y, GAME_X, GAME_Y)
+        draw_bullets(screen, bullets, camera_x, camera_y, GAME_X, GAME_Y, quality.settings['beam_trail_length'])
+        draw_spray_particles(screen, SPRAY_PARTICLES, camera_x, camera_y, GAME_X, GAME_Y)
         player_screen_x = players[0].rect.centerx - camera_x + GAME_X
         player_screen_y = players[0].rect.centery - camera_y + GAME_Y
         aim_dx, aim_dy = players[0].aim_direction # JAKE THIS WILL NEED TO BE CHANGED FOR MULTIPLAYER
@@ -145,7 +175,7 @@ def main():
                 { 'type': 'cone', 'x': player_screen_x, 'y': player_screen_y, 'radius': 300, 'angle': player_angle, 'spread': 45 } # Example of a cone light
 
         ]
-        draw_darkness_overlay(screen, darkness_alpha, lights)
+        draw_darkness_overlay(screen, darkness_alpha, lights, quality.settings['light_resolution'])
         for i, player in enumerate(players):
             player.draw(screen, camera_x, camera_y, player_index=i, current_weapon_index=player_weapon_indices[i], game_x=GAME_X, game_y=GAME_Y)
         if all_dead:
@@ -167,7 +197,9 @@ def main():
 
             
             start_ticks += paused_ms         
-            spawn_timer += paused_ms         
+            spawn_director.last_spawn += paused_ms
+            region_manager.shift_time(paused_ms)
+            quality.shift_time(paused_ms)
 
 
 
@@ -1,6 +1,8 @@
 import pygame
 import math
 
+from game.asset_cache import get_font
+
 class Player:
     def __init__(self, x, y, character, tile_size):
         self.x = x
@@ -219,7 +221,7 @@ class Player:
         # --- Ammo UI to the right of HP bar for all players ---
         weapon = self.character.weapons[current_weapon_index] if hasattr(self.character, 'weapons') and len(self.character.weapons) > current_weapon_index else None
         if weapon:
-            ammo_font = pygame.font.Font(None, 18)
+            ammo_font = get_font(None, 18)
             if weapon.common.ammo is None:
                 reserve_text = "∞"
             else:
@@ -0,0 +1,211 @@
+from enum import IntEnum
+
+
+class ProjectileKind(IntEnum):
+    BULLET = 0
+    BEAM = 1
+    ORBITAL = 2
+    ORBITAL_BEAM = 3
+    GRENADE = 4
+    MINE = 5
+
+
+class Projectile:
+    """
+    Fields every projectile kind shares. Each subclass names its kind in `kind`, so
+    update and draw code dispatches on one integer instead of probing flags, and
+    lists its fields in __slots__, so instances carry no per-object dict.
+    """
+    __slots__ = ('x', 'y', 'size', 'damage', 'color', 'enemy_effects', 'burn_damage', 'weapon_name', 'owner')
+    kind = None
+    # pygame.time.get_ticks() timestamps that must move forward after a pause
+    TIME_FIELDS = ()
+
+    def __init__(self, x, y, size, damage, color, enemy_effects, burn_damage=None, weapon_name=None, owner=None):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.damage = damage
+        self.color = color
+        self.enemy_effects = enemy_effects
+        self.burn_damage = burn_damage  # None: burns for 30% of the current damage
+        # Who to credit in the damage totals
+        self.weapon_name = weapon_name
+        self.owner = owner  # Player who fired it
+
+    def shift_time(self, paused_ms):
+        for name in self.TIME_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                setattr(self, name, value + paused_ms)
+
+
+class Bullet(Projectile):
+    """A fired shot travelling along (dx, dy); the base for every create_bullet kind."""
+    __slots__ = ('dx', 'dy', 'speed', 'range', 'distance', 'original_damage', 'splash', 'weapon_index',
+                 'contact_effect', 'bounces', 'bounce_limit', 'pierces_left', 'knockback_force',
+                 'hit_creatures', 'homing_angle', 'homing_time', 'homing_timer')
+    kind = ProjectileKind.BULLET
+
+    def __init__(self, template, x, y, dx, dy, weapon_index, owner=None):
+        self.stamp(template, x, y, dx, dy, weapon_index, owner)
+
+    def stamp(self, template, x, y, dx, dy, weapon_index, owner=None):
+        """(Re)initialise every field from a weapon's ShotTemplate plus this shot's position and direction."""
+        self.x = x
+        self.y = y
+        self.size = template.size
+        self.damage = template.damage
+        self.color = template.color
+        self.enemy_effects = template.enemy_effects
+        self.burn_damage = template.burn_damage  # None: burns for 30% of the current damage
+        self.weapon_name = template.name
+        self.owner = owner
+        self.dx = dx
+        self.dy = dy
+        self.speed = template.speed
+        self.range = template.range
+        self.distance = 0
+        self.original_damage = template.damage
+        self.splash = template.splash
+        self.weapon_index = weapon_index
+        self.contact_effect = template.contact_effect
+        self.bounces = 0
+        self.bounce_limit = template.bounce_limit
+        self.pierces_left = template.piercing
+        self.knockback_force = template.knockback_force
+        self.hit_creatures = None  # ids of creatures already pierced, created on the first hit
+        self.homing_angle = template.homing_angle
+        self.homing_time = template.homing_time
+        self.homing_timer = 0  # ms
+
+
+class Mine(Bullet):
+    """Stays where it was dropped and explodes when a creature comes within trigger_radius."""
+    __slots__ = ('trigger_radius',)
+    kind = ProjectileKind.MINE
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trigger_radius = 32
+
+
+class Orbital(Bullet):
+    """Missile falling from `z` onto its ground target at (x, y)."""
+    __slots__ = ('z', 'initial_z', 'fall_speed')
+    kind = ProjectileKind.ORBITAL
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.z = self.initial_z = 0
+        self.fall_speed = 0
+
+
+class OrbitalBeam(Bullet):
+    """Charges up at the cursor, then follows it dealing area damage every tick."""
+    __slots__ = ('beam_duration', 'beam_start_time', 'beam_damage_tick', 'last_damage_time',
+                 'beam_active', 'warm_up_start', 'warm_up_time', 'mouse_follow')
+    kind = ProjectileKind.ORBITAL_BEAM
+    TIME_FIELDS = ('beam_start_time', 'last_damage_time', 'warm_up_start')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.beam_duration = 5.0
+        self.beam_start_time = self.last_damage_time = self.warm_up_start = None
+        self.beam_damage_tick = 0.2
+        self.beam_active = False
+        self.warm_up_time = 2.0
+        self.mouse_follow = True
+
+
+class Grenade(Bullet):
+    """Thrown in an arc to a landing spot, rolls to a stop and explodes on its timer."""
+    __slots__ = ('detonation_time', 'creation_time', 'velocity_x', 'velocity_y', 'start_x', 'start_y',
+                 'landing_x', 'landing_y', 'phase', 'roll_distance', 'roll_dx', 'roll_dy', 'roll_left',
+                 'direction_vec', 'travel_distance', 'distance_traveled')
+    kind = ProjectileKind.GRENADE
+    TIME_FIELDS = ('creation_time',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.detonation_time = self.creation_time = None
+        self.velocity_x = self.velocity_y = 0
+        self.start_x, self.start_y = self.x, self.y
+        self.landing_x, self.landing_y = self.x, self.y
+        self.phase = 'flying'
+        self.roll_distance = self.roll_left = 0
+        self.roll_dx = self.roll_dy = 0
+        self.direction_vec = (0, 0)
+        self.travel_distance = self.distance_traveled = 0
+
+
+class Beam(Projectile):
+    """Lightning-fast piercing beam that leaves a trail of recent positions."""
+    __slots__ = ('angle', 'speed', 'range', 'piercing', 'hits', 'trail_points')
+    kind = ProjectileKind.BEAM
+
+    def __init__(self, x, y, angle, speed, range, size, damage, color, piercing, enemy_effects, trail_points, weapon_name=None, owner=None):
+        super().__init__(x, y, size, damage, color, enemy_effects, weapon_name=weapon_name, owner=owner)
+        self.angle = angle
+        self.speed = speed
+        self.range = range
+        self.piercing = piercing
+        self.hits = set()  # Track creatures hit to prevent multiple hits
+        self.trail_points = trail_points
+
+
+class BulletPool:
+    """
+    Recycles plain Bullets. acquire() re-stamps a spent bullet when one is free
+    instead of allocating, and update_bullets hands bullets back with release()
+    when they hit something or run out of range.
+    """
+    def __init__(self, limit=2048):
+        self.limit = limit
+        self.free = []
+
+    def acquire(self, template, x, y, dx, dy, weapon_index, owner=None):
+        if self.free:
+            bullet = self.free.pop()
+            bullet.stamp(template, x, y, dx, dy, weapon_index, owner)
+            return bullet
+        return Bullet(template, x, y, dx, dy, weapon_index, owner)
+
+    def release(self, bullet):
+        if len(self.free) < self.limit:
+            self.free.append(bullet)
+
+
+# Shared pool for plain bullets; create_bullet draws from it and update_bullets returns to it
+BULLET_POOL = BulletPool()
+
+
+class ProjectileGroups:
+    """
+    Live projectiles partitioned by kind when they are added, so each kind can be
+    updated and drawn by its own loop without testing kinds per projectile.
+    Iterating yields every projectile, one kind after another.
+    """
+    def __init__(self):
+        self.groups = {kind: [] for kind in ProjectileKind}
+
+    def append(self, projectile):
+        self.groups[projectile.kind].append(projectile)
+
+    def extend(self, projectiles):
+        for projectile in projectiles:
+            self.groups[projectile.kind].append(projectile)
+
+    def of_kind(self, kind):
+        return self.groups[kind]
+
+    def clear(self):
+        for group in self.groups.values():
+            group.clear()
+
+    def __len__(self):
+        return sum(len(group) for group in self.groups.values())
+
+    def __iter__(self):
+        for group in self.groups.values():
+            yield from group
@@ -0,0 +1,113 @@
+from collections import deque
+
+# Full-quality values for every feature the governor controls
+DEFAULT_QUALITY = {
+    'burn_density': 1.0,       # fraction of burning flame/smoke/ember particles drawn
+    'beam_trail_length': 20,   # beam trail points drawn
+    'light_resolution': 1.0,   # darkness overlay resolution relative to the screen
+    'lod_band_scale': 1.0,     # AI_LOD.band_scale
+    'spawn_rate': 1.0,         # SpawnDirector.rate_scale
+}
+
+# Ladder of quality steps, cheapest visual loss first. Stepping down applies the next
+# entry; stepping up undoes the last one.
+QUALITY_STEPS = (
+    ('burn_density', 0.5),
+    ('beam_trail_length', 12),
+    ('light_resolution', 0.5),
+    ('lod_band_scale', 0.75),
+    ('spawn_rate', 0.75),
+    ('burn_density', 0.0),
+    ('beam_trail_length', 6),
+    ('light_resolution', 0.25),
+    ('lod_band_scale', 0.5),
+    ('spawn_rate', 0.5),
+)
+
+
+class QualityGovernor:
+    """
+    Watches a rolling window of frame work times and walks the QUALITY_STEPS ladder:
+    down one step when the average is over `budget_ms * high`, and back up one step when
+    it is under `budget_ms * low`. Steps are rate limited so the effect of a change
+    shows up in the window before the next decision.
+
+    Every step is appended to `history` and passed to subscribed callbacks, and
+    `report()` summarises the current state for tuning the thresholds.
+    """
+    def __init__(self, budget_ms=1000 / 60, window=60, high=1.1, low=0.75,
+                 down_cooldown=1000, up_cooldown=4000, steps=QUALITY_STEPS):
+        self.budget_ms = budget_ms
+        self.high = high
+        self.low = low
+        self.down_cooldown = down_cooldown  # ms between two step-downs
+        self.up_cooldown = up_cooldown      # ms after any step before stepping up
+        self.steps = steps
+        self.level = 0  # number of ladder steps applied
+        self.frame_times = deque(maxlen=window)
+        self.history = deque(maxlen=200)
+        self.settings = dict(DEFAULT_QUALITY)
+        self.last_step = None
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """Call `callback(step)` with each history entry as it is recorded."""
+        self._listeners.append(callback)
+
+    def average_frame_ms(self):
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def record(self, frame_ms, now):
+        """Add one frame's work time and step quality if needed; returns the step taken, if any."""
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return None
+        avg = self.average_frame_ms()
+        since = None if self.last_step is None else now - self.last_step
+        if avg > self.budget_ms * self.high and self.level < len(self.steps):
+            if since is None or since >= self.down_cooldown:
+                return self._set_level(self.level + 1, now, avg)
+        elif avg < self.budget_ms * self.low and self.level > 0:
+            if since is None or since >= self.up_cooldown:
+                return self._set_level(self.level - 1, now, avg)
+        return None
+
+    def _set_level(self, level, now, avg):
+        direction = 'down' if level > self.level else 'up'
+        feature = self.steps[max(level, self.level) - 1][0]
+        self.level = level
+        self.settings = dict(DEFAULT_QUALITY)
+        for name, value in self.steps[:level]:
+            self.settings[name] = value
+        self.last_step = now
+        step = {
+            'time': now,
+            'direction': direction,
+            'level': level,
+            'feature': feature,
+            'value': self.settings[feature],
+            'avg_frame_ms': avg,
+        }
+        self.history.append(step)
+        for callback in self._listeners:
+            callback(step)
+        return step
+
+    def shift_time(self, paused_ms):
+        """Keep the step cooldowns in step with the game clock after a pause."""
+        if self.last_step is not None:
+            self.last_step += paused_ms
+
+    def report(self):
+        return {
+            'level': self.level,
+            'max_level': len(self.steps),
+            'avg_frame_ms': self.average_frame_ms(),
+            'budget_ms': self.budget_ms,
+            'step_down_above_ms': self.budget_ms * self.high,
+            'step_up_below_ms': self.budget_ms * self.low,
+            'settings': dict(self.settings),
+            'history': list(self.history),
+        }
@@ -0,0 +1,109 @@
+import math
+
+# Region chunks are square blocks of tiles; dormant creatures are bucketed by chunk
+CHUNK_TILES = 16
+
+
+class RegionManager:
+    """
+    Bounds the active simulation set. Living creatures farther than `sleep_distance`
+    from every living player are put to sleep: they are removed from the creature list
+    and stored per chunk as compact (class, x, y, hp, facing, center, slept_at) records.
+    Chunks near a player are searched for sleepers, and each sleeper whose own center
+    is within `wake_distance` of a player is rebuilt in place, as long as the creature
+    list is under the cap passed to update(). Sleepers left alone for longer than `ttl`
+    milliseconds are dropped for good.
+
+    Status effects (burning, poison, slow, knockback) do not survive sleep.
+    """
+    def __init__(self, tile_size, sleep_distance=2400, wake_distance=1800, ttl=120000, interval=500):
+        if wake_distance >= sleep_distance:
+            raise ValueError("wake_distance must be below sleep_distance")
+        self.chunk_size = tile_size * CHUNK_TILES
+        self.sleep_distance = sleep_distance
+        self.wake_distance = wake_distance  # below sleep_distance so creatures do not flicker on the edge
+        self.ttl = ttl
+        self.interval = interval  # milliseconds between region checks
+        self.dormant = {}  # (chunk_x, chunk_y) -> list of records
+        self.last_check = None
+
+    def update(self, creatures, players, now, cap=None):
+        """
+        Sleep, wake and expire creatures; the creature list is updated in place. Waking
+        stops once the list holds `cap` creatures (the spawn director's live cap); the
+        rest stay asleep until there is room.
+        """
+        if self.last_check is not None and now - self.last_check < self.interval:
+            return
+        self.last_check = now
+        centers = [p.rect.center for p in players if not p.dead]
+        if not centers:
+            return
+
+        self._sleep(creatures, centers, now)
+        self._expire(now)
+        self._wake(creatures, centers, cap)
+
+    def _sleep(self, creatures, centers, now):
+        limit = self.sleep_distance ** 2
+        awake = []
+        for c in creatures:
+            cx, cy = c.rect.center
+            if c.hp > 0 and all((px - cx) ** 2 + (py - cy) ** 2 > limit for px, py in centers):
+                key = (int(cx // self.chunk_size), int(cy // self.chunk_size))
+                self.dormant.setdefault(key, []).append((type(c), c.x, c.y, c.hp, c.facing, (cx, cy), now))
+            else:
+                awake.append(c)
+        if len(awake) != len(creatures):
+            creatures[:] = awake
+
+    def _expire(self, now):
+        for key in list(self.dormant):
+            records = [r for r in self.dormant[key] if now - r[-1] < self.ttl]
+            if records:
+                self.dormant[key] = records
+            else:
+                del self.dormant[key]
+
+    def _wake(self, creatures, centers, cap=None):
+        if not self.dormant or (cap is not None and len(creatures) >= cap):
+            return
+        size = self.chunk_size
+        reach = int(math.ceil(self.wake_distance / size))
+        limit = self.wake_distance ** 2
+        for px, py in centers:
+            pcx, pcy = int(px // size), int(py // size)
+            for key_x in range(pcx - reach, pcx + reach + 1):
+                for key_y in range(pcy - reach, pcy + reach + 1):
+                    records = self.dormant.get((key_x, key_y))
+                    if not records:
+                        continue
+                    # Distance from the player to the closest point of the chunk
+                    nx = min(max(px, key_x * size), (key_x + 1) * size)
+                    ny = min(max(py, key_y * size), (key_y + 1) * size)
+                    if (nx - px) ** 2 + (ny - py) ** 2 > limit:
+                        continue
+                    # The chunk is in reach, but only sleepers that are themselves within
+                    # wake_distance wake, so none can be past sleep_distance again
+                    asleep = []
+                    for record in records:
+                        cls, x, y, hp, facing, (cx, cy), _ = record
+                        if (cap is not None and len(creatures) >= cap) or \
+                                all((ox - cx) ** 2 + (oy - cy) ** 2 > limit for ox, oy in centers):
+                            asleep.append(record)
+                            continue
+                        creature = cls(x=x, y=y)
+                        creature.hp = hp
+                        creature.facing = facing
+                        creatures.append(creature)
+                    if asleep:
+                        self.dormant[(key_x, key_y)] = asleep
+                    else:
+                        del self.dormant[(key_x, key_y)]
+
+    def shift_time(self, paused_ms):
+        """Keep sleep timestamps in step with the game clock after a pause."""
+        if self.last_check is not None:
+            self.last_check += paused_ms
+        for key, records in self.dormant.items():
+            self.dormant[key] = [r[:-1] + (r[-1] + paused_ms,) for r in records]
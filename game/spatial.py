@@ -0,0 +1,226 @@
+import math
+
+
+class SpatialHash:
+    """
+    Uniform grid that buckets objects with a `rect` by the cell containing their center.
+
+    Each object lives in exactly one cell, so queries never return duplicates.
+    Queries are padded by the largest half-extent seen on insert so objects whose
+    center sits in a neighbouring cell but whose rect overlaps the query are still found.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.max_extent = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.max_extent = 0
+
+    def insert(self, obj):
+        rect = obj.rect
+        key = (rect.centerx // self.cell_size, rect.centery // self.cell_size)
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [obj]
+        else:
+            bucket.append(obj)
+        extent = max(rect.width, rect.height) // 2 + 1
+        if extent > self.max_extent:
+            self.max_extent = extent
+
+    def rebuild(self, objs):
+        """Clear the grid and re-insert every object (call once per tick after movement)."""
+        self.clear()
+        for obj in objs:
+            self.insert(obj)
+
+    def _cells_in(self, left, top, right, bottom, pad=None):
+        cs = self.cell_size
+        if pad is None:
+            pad = self.max_extent
+        cells = self.cells
+        for cy in range((top - pad) // cs, (bottom + pad) // cs + 1):
+            for cx in range((left - pad) // cs, (right + pad) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield bucket
+
+    def query_point(self, x, y, pad=0):
+        """Return objects whose rect, grown by `pad` on every side, contains (x, y)."""
+        found = []
+        ix, iy = int(x), int(y)
+        for bucket in self._cells_in(ix, iy, ix, iy, pad=self.max_extent + pad):
+            for obj in bucket:
+                rect = obj.rect
+                if rect.left - pad <= x < rect.right + pad and rect.top - pad <= y < rect.bottom + pad:
+                    found.append(obj)
+        return found
+
+    def query_radius(self, x, y, radius):
+        """Return (obj, distance) pairs whose rect center lies within `radius` of (x, y)."""
+        found = []
+        r = int(math.ceil(radius))
+        r_sq = radius * radius
+        for bucket in self._cells_in(int(x) - r, int(y) - r, int(x) + r, int(y) + r, pad=0):
+            for obj in bucket:
+                dx = obj.rect.centerx - x
+                dy = obj.rect.centery - y
+                d_sq = dx * dx + dy * dy
+                if d_sq <= r_sq:
+                    found.append((obj, math.sqrt(d_sq)))
+        return found
+
+    def query_segment(self, x0, y0, x1, y1, pad=0):
+        """
+        Return (t_entry, obj) pairs for objects whose rect, grown by `pad`, is touched by
+        the segment (x0, y0) -> (x1, y1), sorted by entry fraction t in [0, 1].
+        Only cells near the segment are visited, so long beam steps stay cheap.
+        """
+        cs = self.cell_size
+        reach = self.max_extent + pad
+        dx = x1 - x0
+        dy = y1 - y0
+        cells = self.cells
+        found = []
+        # Walk cell rows; in each row only the cells within `reach` of the part of the
+        # segment that passes through that row's band can hold a touching object
+        for cy in range(int((min(y0, y1) - reach) // cs), int((max(y0, y1) + reach) // cs) + 1):
+            if dy:
+                ta = (cy * cs - reach - y0) / dy
+                tb = ((cy + 1) * cs + reach - y0) / dy
+                lo = max(0.0, min(ta, tb))
+                hi = min(1.0, max(ta, tb))
+                if lo > hi:
+                    continue
+                xa = x0 + dx * lo
+                xb = x0 + dx * hi
+            else:
+                xa, xb = x0, x1
+            for cx in range(int((min(xa, xb) - reach) // cs), int((max(xa, xb) + reach) // cs) + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for obj in bucket:
+                    t = segment_entry(obj.rect, x0, y0, dx, dy, pad)
+                    if t is not None:
+                        found.append((t, obj))
+        found.sort(key=lambda hit: hit[0])
+        return found
+
+
+def segment_entry(rect, x0, y0, dx, dy, pad=0):
+    """Slab test: fraction t in [0, 1] where (x0, y0) + t*(dx, dy) enters `rect` grown by `pad`, or None."""
+    t_enter = 0.0
+    t_exit = 1.0
+    for origin, delta, low, high in ((x0, dx, rect.left - pad, rect.right + pad),
+                                     (y0, dy, rect.top - pad, rect.bottom + pad)):
+        if delta == 0:
+            if origin < low or origin > high:
+                return None
+            continue
+        t0 = (low - origin) / delta
+        t1 = (high - origin) / delta
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_enter:
+            t_enter = t0
+        if t1 < t_exit:
+            t_exit = t1
+        if t_enter > t_exit:
+            return None
+    return t_enter
+
+
+class WallGrid:
+    """
+    Wall tiles stored as a set of (col, row) coordinates for O(1) lookups.
+
+    Hits are returned as (col, row, normal_x, normal_y, t) where the normal is the
+    face of the tile that was entered and t is the fraction of the segment travelled.
+    """
+    def __init__(self, tile_size, tiles=None):
+        self.tile_size = tile_size
+        self.tiles = tiles if tiles is not None else set()
+
+    @classmethod
+    def from_rects(cls, walls, tile_size=None):
+        if tile_size is None:
+            tile_size = walls[0].width if walls else 32
+        return cls(tile_size, {(wall.x // tile_size, wall.y // tile_size) for wall in walls})
+
+    def is_wall(self, col, row):
+        return (col, row) in self.tiles
+
+    def is_wall_at(self, x, y):
+        ts = self.tile_size
+        return (math.floor(x / ts), math.floor(y / ts)) in self.tiles
+
+    def raycast(self, x0, y0, x1, y1):
+        """
+        Walk only the tiles crossed by the segment (x0, y0) -> (x1, y1) (grid DDA) and
+        return the first wall hit, or None. A segment starting inside a wall reports
+        that tile with a zero normal.
+        """
+        ts = self.tile_size
+        tiles = self.tiles
+        col = math.floor(x0 / ts)
+        row = math.floor(y0 / ts)
+        if (col, row) in tiles:
+            return (col, row, 0, 0, 0.0)
+
+        dx = x1 - x0
+        dy = y1 - y0
+        if dx > 0:
+            step_x, t_max_x, t_delta_x = 1, ((col + 1) * ts - x0) / dx, ts / dx
+        elif dx < 0:
+            step_x, t_max_x, t_delta_x = -1, (col * ts - x0) / dx, -ts / dx
+        else:
+            step_x, t_max_x, t_delta_x = 0, math.inf, math.inf
+        if dy > 0:
+            step_y, t_max_y, t_delta_y = 1, ((row + 1) * ts - y0) / dy, ts / dy
+        elif dy < 0:
+            step_y, t_max_y, t_delta_y = -1, (row * ts - y0) / dy, -ts / dy
+        else:
+            step_y, t_max_y, t_delta_y = 0, math.inf, math.inf
+
+        while True:
+            if t_max_x < t_max_y:
+                t = t_max_x
+                if t > 1:
+                    return None
+                col += step_x
+                t_max_x += t_delta_x
+                normal = (-step_x, 0)
+            else:
+                t = t_max_y
+                if t > 1:
+                    return None
+                row += step_y
+                t_max_y += t_delta_y
+                normal = (0, -step_y)
+            if (col, row) in tiles:
+                return (col, row, normal[0], normal[1], t)
+
+    def rect_hit(self, rect):
+        """
+        Return the first wall tile overlapping `rect` as a hit tuple, or None. The normal
+        points along the axis on which the rect's center lies outside the tile.
+        """
+        ts = self.tile_size
+        tiles = self.tiles
+        cx, cy = rect.center
+        for row in range(rect.top // ts, (rect.bottom - 1) // ts + 1):
+            for col in range(rect.left // ts, (rect.right - 1) // ts + 1):
+                if (col, row) in tiles:
+                    if cx < col * ts:
+                        return (col, row, -1, 0, 1.0)
+                    if cx >= (col + 1) * ts:
+                        return (col, row, 1, 0, 1.0)
+                    if cy < row * ts:
+                        return (col, row, 0, -1, 1.0)
+                    if cy >= (row + 1) * ts:
+                        return (col, row, 0, 1, 1.0)
+                    return (col, row, 0, 0, 1.0)
+        return None
@@ -0,0 +1,129 @@
+import math
+import random
+
+from game.creatures import CREATURE_DIFFICULTY_POOLS
+
+
+class SpawnDirector:
+    """
+    Decides when, where and what to spawn.
+
+    - Placement: points are sampled uniformly on a ring around a random living player
+      and accepted only if their tile is open (an O(1) lookup in the world's tile
+      cache) and they are at least `min_distance` from every living player. The
+      creature is centred on the tile, and its whole rect must be clear of walls.
+    - Budget: the live-creature cap adapts to the measured frame time. While frames
+      run over `frame_budget_ms` it drops below the current population, and it climbs
+      back toward `max_creatures` while there is headroom. `max_creatures` is only a
+      hard ceiling, set well above the swarms the AI is built for. Spawning is skipped on frames that are over budget unless fewer
+      than `min_creatures` are alive.
+    - Archetype: the difficulty pool comes from elapsed minutes plus how far from the
+      world origin the spawn point is, so travelling further brings harder creatures.
+    """
+    def __init__(self, tile_size, min_distance, max_distance, pools=CREATURE_DIFFICULTY_POOLS,
+                 base_interval=5000, min_interval=300, max_creatures=500, min_creatures=10,
+                 frame_budget_ms=1000 / 60, attempts=16,
+                 minutes_per_tier=1, max_time_tier=1, distance_per_tier=150):
+        self.tile_size = tile_size
+        self.min_distance = min_distance
+        self.max_distance = max_distance
+        self.pools = pools
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_creatures = max_creatures
+        self.min_creatures = min_creatures
+        self.frame_budget_ms = frame_budget_ms
+        self.attempts = attempts
+        self.minutes_per_tier = minutes_per_tier
+        self.max_time_tier = max_time_tier
+        self.distance_per_tier = distance_per_tier  # tiles from the origin per extra tier
+        self.creature_cap = max_creatures
+        self.rate_scale = 1.0  # multiplies the spawn rate (see QualityGovernor)
+        self.avg_frame_ms = 0.0
+        self.last_spawn = 0
+
+    def interval(self, minutes):
+        """Milliseconds between spawns: halves every minute down to min_interval, then rate scaled."""
+        return max(self.min_interval, self.base_interval // (2 ** minutes)) / max(self.rate_scale, 0.01)
+
+    def update(self, creatures, players, world, now, elapsed_ms, frame_ms):
+        """Spawn at most one creature this tick. `frame_ms` is the last frame's work time."""
+        self._adapt(frame_ms, len(creatures))
+        minutes = elapsed_ms // 60000
+        if now - self.last_spawn <= self.interval(minutes):
+            return None
+        self.last_spawn = now
+        if len(creatures) >= self.creature_cap:
+            return None
+        # A slow frame postpones spawning, but never below the minimum population
+        if frame_ms > self.frame_budget_ms and len(creatures) >= self.min_creatures:
+            return None
+
+        spot = self.sample_spawn_point(players, world)
+        if spot is None:
+            return None
+        cx, cy = spot
+        creature_class, kwargs = random.choice(self.pools[self.pool_index(minutes, cx, cy)])
+        creature = creature_class(x=cx, y=cy, **kwargs)
+        w, h = creature.rect.size
+        if not self.area_open(world, cx - w / 2, cy - h / 2, w, h):
+            # Too big for this tile's surroundings; find a spot its whole body fits on
+            spot = self.sample_spawn_point(players, world, (w, h))
+            if spot is None:
+                return None
+            cx, cy = spot
+        creature.x = cx - w / 2
+        creature.y = cy - h / 2
+        creature.rect.topleft = (creature.x, creature.y)
+        creatures.append(creature)
+        return creature
+
+    def _adapt(self, frame_ms, alive):
+        # Exponential moving average smooths out single slow frames
+        self.avg_frame_ms += (frame_ms - self.avg_frame_ms) * 0.1
+        if self.avg_frame_ms > self.frame_budget_ms * 1.1:
+            # Start from the live count so a high ceiling does not delay the cut
+            self.creature_cap = max(self.min_creatures, min(self.creature_cap, alive) - 1)
+        elif self.avg_frame_ms < self.frame_budget_ms * 0.8:
+            self.creature_cap = min(self.max_creatures, self.creature_cap + 1)
+
+    def pool_index(self, minutes, x, y):
+        time_tier = min(minutes // self.minutes_per_tier, self.max_time_tier)
+        distance_tier = int(math.hypot(x, y) / self.tile_size // self.distance_per_tier)
+        return min(len(self.pools) - 1, time_tier + distance_tier)
+
+    def area_open(self, world, x, y, width, height):
+        """True if no tile under the rect (x, y, width, height) is a wall."""
+        ts = self.tile_size
+        for row in range(int(y // ts), int((y + height - 1) // ts) + 1):
+            for col in range(int(x // ts), int((x + width - 1) // ts) + 1):
+                if world.get_tile(col, row) == 'W':
+                    return False
+        return True
+
+    def sample_spawn_point(self, players, world, size=None):
+        """
+        Center of an open tile on the spawn ring, or None if every attempt hit a wall.
+        With `size` (width, height), a rect that size centred on the tile must be open too.
+        """
+        living = [p.rect.center for p in players if not p.dead]
+        if not living:
+            return None
+        ts = self.tile_size
+        min_sq = self.min_distance ** 2
+        outer_sq = self.max_distance ** 2
+        for _ in range(self.attempts):
+            px, py = random.choice(living)
+            angle = random.uniform(0, 2 * math.pi)
+            # Uniform over the ring's area rather than bunched at its inner edge
+            r = math.sqrt(random.uniform(min_sq, outer_sq))
+            col = int((px + math.cos(angle) * r) // ts)
+            row = int((py + math.sin(angle) * r) // ts)
+            if world.get_tile(col, row) == 'W':
+                continue
+            cx, cy = (col + 0.5) * ts, (row + 0.5) * ts
+            if size and not self.area_open(world, cx - size[0] / 2, cy - size[1] / 2, *size):
+                continue
+            if all((ox - cx) ** 2 + (oy - cy) ** 2 >= min_sq for ox, oy in living):
+                return cx, cy
+        return None
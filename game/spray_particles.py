@@ -0,0 +1,127 @@
+from game.helpers.combat_helpers.apply_creature_effects import apply_creature_effects
+from game.damage import is_alive
+
+
+class SprayParticleSystem:
+    """
+    Short-lived particles for SPRAY fire mode weapons (flamethrowers, ice and poison
+    sprays), kept apart from the general bullet list.
+
+    Particles live in parallel lists indexed by particle, and everything they share
+    with the rest of their volley (damage, effects, color, size) stays in one
+    per-shot template Bullet. Collision is deliberately simple:
+      - walls: one tile lookup at the particle's new position,
+      - creatures: a point query on the creature grid, grown by the particle size.
+    Hits are counted per (creature, template) during the tick and applied in one
+    apply_creature_effects call each, so a creature engulfed by a spray takes one
+    batched hit per tick instead of one per particle.
+    """
+    def __init__(self):
+        self.templates = []  # per-shot shared Bullets
+        self.template = []   # index into templates
+        self.x = []
+        self.y = []
+        self.vx = []
+        self.vy = []
+        self.ticks_left = []  # ticks of travel before the particle's range runs out
+        self.hits_left = []
+        self.hit_ids = []    # ids of creatures already hit, None until the first hit
+        self.size_scale = []
+        self.phase = []
+
+    def __len__(self):
+        return len(self.x)
+
+    def emit(self, template, particles):
+        """
+        Add one volley. `template` is the shot's Bullet (position, range, size,
+        damage, enemy effects, piercing); `particles` yields (dx, dy, speed, size_scale,
+        phase) per particle.
+        """
+        index = len(self.templates)
+        self.templates.append(template)
+        x, y = template.x, template.y
+        hits = template.pierces_left + 1
+        for dx, dy, speed, size_scale, phase in particles:
+            self.template.append(index)
+            self.x.append(x)
+            self.y.append(y)
+            self.vx.append(dx * speed)
+            self.vy.append(dy * speed)
+            self.ticks_left.append(template.range / speed if speed else 0)
+            self.hits_left.append(hits)
+            self.hit_ids.append(None)
+            self.size_scale.append(size_scale)
+            self.phase.append(phase)
+
+    def update(self, wall_grid, creature_grid):
+        """Advance every particle one tick, then apply the tick's batched creature damage."""
+        templates = self.templates
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        ticks_left, hits_left, hit_ids = self.ticks_left, self.hits_left, self.hit_ids
+        tile_size = wall_grid.tile_size
+        walls = wall_grid.tiles
+        hits = {}
+        keep = 0
+        for i in range(len(x)):
+            px = x[i] + vx[i]
+            py = y[i] + vy[i]
+            life = ticks_left[i] - 1
+            if life < 0 or (int(px // tile_size), int(py // tile_size)) in walls:
+                continue
+            t = self.template[i]
+            alive = True
+            for creature in creature_grid.query_point(px, py, templates[t].size):
+                if not is_alive(creature):
+                    continue
+                seen = hit_ids[i]
+                if seen is None:
+                    seen = hit_ids[i] = set()
+                elif creature.id in seen:
+                    continue
+                seen.add(creature.id)
+                key = (creature, t)
+                hits[key] = hits.get(key, 0) + 1
+                hits_left[i] -= 1
+                if hits_left[i] <= 0:
+                    alive = False
+                    break
+            if not alive:
+                continue
+            # Compact survivors to the front
+            x[keep] = px
+            y[keep] = py
+            vx[keep] = vx[i]
+            vy[keep] = vy[i]
+            ticks_left[keep] = life
+            hits_left[keep] = hits_left[i]
+            hit_ids[keep] = hit_ids[i]
+            self.template[keep] = t
+            self.size_scale[keep] = self.size_scale[i]
+            self.phase[keep] = self.phase[i]
+            keep += 1
+        for values in (x, y, vx, vy, ticks_left, hits_left, hit_ids, self.template, self.size_scale, self.phase):
+            del values[keep:]
+
+        for (creature, t), count in hits.items():
+            apply_creature_effects(templates[t], creature, count)
+
+        self._drop_unused_templates()
+
+    def _drop_unused_templates(self):
+        if not self.x:
+            self.templates.clear()
+        elif len(self.templates) > 64:
+            # Renumber the templates still referenced so the list does not grow forever
+            remap = {}
+            templates = []
+            for i, t in enumerate(self.template):
+                if t not in remap:
+                    remap[t] = len(templates)
+                    templates.append(self.templates[t])
+                self.template[i] = remap[t]
+            self.templates = templates
+
+
+# Shared spray particle system; handle_firing emits into it and the main loop updates and draws it
+SPRAY_PARTICLES = SprayParticleSystem()
@@ -3,7 +3,9 @@ from game.helpers.ui_helpers.draw_bullets import draw_bullets
 from game.helpers.ui_helpers.draw_creatures import draw_creatures
 from game.helpers.ui_helpers.draw_darkness_overlay import draw_darkness_overlay
 from game.helpers.ui_helpers.draw_game_over import draw_game_over
+from game.helpers.ui_helpers.draw_loading_screen import draw_loading_screen
 from game.helpers.ui_helpers.draw_splash_effects import draw_splash_effects
+from game.helpers.ui_helpers.draw_spray_particles import draw_spray_particles
 from game.helpers.ui_helpers.draw_stats_ui import draw_stats_ui
 from game.helpers.ui_helpers.draw_world import draw_world
 from game.helpers.ui_helpers.draw_weapon_info import draw_weapon_info
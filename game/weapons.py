@@ -1,3 +1,4 @@
+import math
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
@@ -82,6 +83,87 @@ class UniqueStats:
     beam_damage_tick: Optional[float] = None
     # Add more unique traits as needed
 
+@dataclass(frozen=True)
+class ShotTemplate:
+    """
+    Everything a shot of one weapon shares, resolved once per tile size:
+    pixel range and size, pierce-over-bounce, burn damage, homing, fire delay,
+    the fixed shotgun pellet rotations and the spray particle angles.
+    create_bullet stamps it into a projectile and adds only the per-shot randomness.
+    """
+    tile_size: int
+    name: str
+    fire_mode: FireMode
+    fire_delay: float  # ms per shot
+    accuracy_spread: float  # radians; each shot deviates up to half of it either way
+    pellet_rotations: tuple  # (cos, sin) per shotgun pellet, empty for other fire modes
+    spray_angles: tuple  # base angle in radians per spray particle before jitter, empty for other fire modes
+    speed: float
+    range: float
+    size: int
+    damage: float
+    color: tuple
+    splash: Optional[float]
+    contact_effect: ContactEffect
+    bounce_limit: int
+    piercing: int
+    enemy_effects: tuple
+    knockback_force: Optional[float]
+    burn_damage: Optional[float]
+    homing_angle: Optional[float]
+    homing_time: float
+
+    @classmethod
+    def compile(cls, weapon, tile_size):
+        common, uncommon = weapon.common, weapon.uncommon
+        # Favor pierce over bounce if both are set
+        piercing = uncommon.piercing or 0
+        bounce_limit = uncommon.bounce_limit or 0
+        if piercing > 0 and bounce_limit > 0:
+            bounce_limit = 0
+
+        pellet_rotations = ()
+        volley = uncommon.volley or 1
+        if common.fire_mode == FireMode.SHOTGUN and volley > 1:
+            spread = uncommon.spread or 0
+            angles = (math.radians((spread / (volley - 1)) * i - spread / 2) for i in range(volley))
+            pellet_rotations = tuple((math.cos(a), math.sin(a)) for a in angles)
+
+        spray_angles = ()
+        if common.fire_mode == FireMode.SPRAY:
+            # Sprays fan out twice as many particles as their volley
+            particles = volley * 2
+            spread = uncommon.spread or 0
+            spray_angles = tuple(math.radians((spread / (particles - 1)) * i - spread / 2) for i in range(particles))
+
+        burn_damage = None
+        if EnemyContactEffect.FIRE in common.enemy_effects:
+            burn_damage = common.damage * 0.3  # 30% of base damage
+
+        return cls(
+            tile_size=tile_size,
+            name=common.name,
+            fire_mode=common.fire_mode,
+            fire_delay=60000 / common.fire_rate,
+            accuracy_spread=math.radians(common.accuracy * 360),
+            pellet_rotations=pellet_rotations,
+            spray_angles=spray_angles,
+            speed=common.bullet_speed,
+            range=common.range * tile_size,
+            size=int(common.bullet_size * tile_size),
+            damage=common.damage,
+            color=common.bullet_color,
+            splash=uncommon.splash,
+            contact_effect=common.contact_effect,
+            bounce_limit=bounce_limit,
+            piercing=piercing,
+            enemy_effects=tuple(common.enemy_effects),
+            knockback_force=uncommon.knockback_force,
+            burn_damage=burn_damage,
+            homing_angle=uncommon.homing_angle or None,
+            homing_time=(uncommon.homing_time or 0) if uncommon.homing_angle else 0,
+        )
+
 class Weapon:
     def __init__(self, common: CommonStats, uncommon: Optional[UncommonStats] = None, unique: Optional[UniqueStats] = None, is_ability: bool = False):
         self.common = common
@@ -94,6 +176,14 @@ class Weapon:
         self.last_shot_time = 0
         self.warm_up_start = None
         self.is_warming_up = False
+        self._shot_template = None
+
+    def shot_template(self, tile_size):
+        """The weapon's ShotTemplate for `tile_size`, compiled on first use and again when the tile size changes."""
+        template = self._shot_template
+        if template is None or template.tile_size != tile_size:
+            template = self._shot_template = ShotTemplate.compile(self, tile_size)
+        return template
 
 # Factory function for the Rusty Pistol
 